@@ -4,26 +4,30 @@ Main Algobot application.
 
 import os
 import sys
+import threading
 import time
 import webbrowser
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
 
-from PyQt5 import QtCore, uic
-from PyQt5.QtCore import QRunnable, QThreadPool
+from PyQt5 import QtCore
+from PyQt5.QtCore import QRunnable, QThread, QThreadPool, QTimer
 from PyQt5.QtGui import QIcon, QTextCursor
-from PyQt5.QtWidgets import QApplication, QCompleter, QFileDialog, QMainWindow, QTableWidgetItem
+from PyQt5.QtWidgets import QApplication, QCompleter, QFileDialog, QMainWindow, QTableView, QTableWidgetItem
 
 import algobot.assets
 from algobot.algodict import get_interface_dictionary
 from algobot.data import Data
 from algobot.enums import BACKTEST, LIVE, LONG, OPTIMIZER, SHORT, SIMULATION, GraphType
-from algobot.graph_helpers import (add_data_to_plot, destroy_graph_plots, get_graph_dictionary,
-                                   set_backtest_graph_limits_and_empty_plots, setup_graph_plots, setup_graphs,
-                                   update_backtest_graph_limits, update_main_graphs)
+from algobot.graph_helpers import (PLOT_REFRESH_INTERVAL_MS, add_data_to_plot, destroy_graph_plots,
+                                   get_graph_dictionary, refresh_dirty_plots, set_backtest_graph_limits_and_empty_plots,
+                                   setup_graph_plots, setup_graphs, update_backtest_graph_limits, update_main_graphs)
 from algobot.helpers import (ROOT_DIR, UNKNOWN, compare_versions, create_folder, create_folder_if_needed,
                              get_caller_string, open_file_or_folder)
 from algobot.interface.about import About
+from algobot.interface.activity_monitor_model import ActivityMonitorModel
 from algobot.interface.builder.strategy_builder import StrategyBuilder
 from algobot.interface.builder.strategy_manager import StrategyManager
 from algobot.interface.config_utils.slot_utils import load_hide_show_strategies
@@ -32,7 +36,9 @@ from algobot.interface.config_utils.strategy_utils import get_strategies
 from algobot.interface.configuration import Configuration
 from algobot.interface.other_commands import OtherCommands
 from algobot.interface.statistics import Statistics
-from algobot.interface.utils import (add_to_table, clear_table, confirm_message_box, create_popup, open_from_msg_box,
+from algobot.interface.utils import (MONITOR_REFRESH_INTERVAL_MS, STATS_REFRESH_INTERVAL_MS, add_rows_to_table,
+                                     add_to_table, clear_table, confirm_message_box, create_popup,
+                                     get_current_time_string, load_ui, open_from_msg_box, set_text_if_changed,
                                      show_and_bring_window_to_front)
 from algobot.news_scraper import scrape_news
 from algobot.slots import initiate_slots
@@ -44,6 +50,19 @@ from algobot.traders.simulation_trader import SimulationTrader
 
 app = QApplication(sys.argv)
 mainUi = os.path.join(ROOT_DIR, 'UI', 'algobot.ui')
+MIN_THREAD_COUNT = 4  # Minimum amount of threads for short-lived tasks, regardless of the amount of cores available.
+
+# Error message tokens and the more helpful messages that replace them when a bot crashes, applied in order. Templates
+# can refer to the original message with {msg} and to the live ticker with {pair}.
+CRASH_MESSAGES = (
+    ('-1021', '{msg} Please sync your system time.'),
+    ('list index out of range',
+     'You may not have any assets in the symbol {pair}. Please check Binance and try again.'),
+    ('Chat not found',
+     'Please check your Telegram bot chat ID or turn off Telegram notifications to get rid of this error.'),
+    ('Invalid token',
+     'Please check your Telegram bot token or turn off Telegram integration to get rid of this error.'),
+)
 
 
 class Interface(QMainWindow):
@@ -56,19 +75,50 @@ class Interface(QMainWindow):
         For available documentation, please visit: https://github.com/ZENALC/algobot/wiki.
     """
 
+    # Names of the attributes holding each caller's trader, lower interval data, and activity monitor.
+    TRADER_ATTRIBUTES = {
+        SIMULATION: 'simulation_trader',
+        LIVE: 'trader',
+        BACKTEST: 'backtester',
+    }
+    LOWER_INTERVAL_DATA_ATTRIBUTES = {
+        SIMULATION: 'simulation_lower_interval_data',
+        LIVE: 'lower_interval_data',
+    }
+    ACTIVITY_MONITOR_ATTRIBUTES = {
+        SIMULATION: 'simulationActivityMonitor',
+        LIVE: 'activityMonitor',
+        BACKTEST: 'backtestTable',
+    }
+
+    # Auxiliary windows that are only created the first time they are accessed. See __getattr__ below.
+    LAZY_WINDOWS = {
+        'other_commands': OtherCommands,
+        'about': About,
+        'strategy_builder': StrategyBuilder,
+        'strategy_manager': StrategyManager,
+        'statistics': Statistics,
+    }
+    other_commands: OtherCommands
+    about: About
+    strategy_builder: StrategyBuilder
+    strategy_manager: StrategyManager
+    statistics: Statistics
+
     def __init__(self, parent=None):
         algobot.assets.qInitResources()
         super(Interface, self).__init__(parent)  # Initializing object
-        uic.loadUi(mainUi, self)  # Loading the main UI
+        load_ui(self, mainUi)  # Loading the main UI
         self.logger = algobot.MAIN_LOGGER
         self.configuration = Configuration(parent=self, logger=self.logger)  # Loading configuration
-        self.other_commands = OtherCommands(self)  # Loading other commands
-        self.about = About(self)  # Loading about information
-        self.strategy_builder = StrategyBuilder(self)
-        self.strategy_manager = StrategyManager(self)
-        self.statistics = Statistics(self)  # Loading statistics
-        self.thread_pool = QThreadPool(self)  # Initiating threading pool
+        self.thread_pool = QThreadPool(self)  # Initiating threading pool for short-lived tasks.
+        self.thread_pool.setMaxThreadCount(max(MIN_THREAD_COUNT, QThread.idealThreadCount()))
         self.threads: Dict[str, QRunnable or None] = {BACKTEST: None, SIMULATION: None, LIVE: None, OPTIMIZER: None}
+
+        # Bots, backtests, and optimizers occupy a thread until they end, so they get their own pool (one thread per
+        # caller) to keep them from starving short-lived tasks such as loading tickers.
+        self.long_running_thread_pool = QThreadPool(self)
+        self.long_running_thread_pool.setMaxThreadCount(len(self.threads))
         self.graphs = (
             {'graph': self.simulationGraph, 'plots': [], 'label': self.simulationCoordinates, 'enable': True},
             {'graph': self.backtestGraph, 'plots': [], 'label': self.backtestCoordinates, 'enable': True},
@@ -76,7 +126,35 @@ class Interface(QMainWindow):
             {'graph': self.avgGraph, 'plots': [], 'label': self.liveAvgCoordinates, 'enable': True},
             {'graph': self.simulationAvgGraph, 'plots': [], 'label': self.simulationAvgCoordinates, 'enable': True},
         )
+        self.graph_dicts = {graph_dict['graph']: graph_dict for graph_dict in self.graphs}  # Graph lookups by widget.
+        self.graph_background = 'w'  # Current background color of all graphs.
         setup_graphs(gui=self)  # Setting up graphs.
+
+        # Plots with new data get redrawn in batches by this timer instead of on every data point added.
+        self.dirty_plots: Dict[int, dict] = {}
+        self.plot_refresh_timer = QTimer(self)
+        self.plot_refresh_timer.timeout.connect(partial(refresh_dirty_plots, self))
+        self.plot_refresh_timer.start(PLOT_REFRESH_INTERVAL_MS)
+
+        # Activity monitors are backed by lightweight models instead of creating a table widget item per cell.
+        for monitor in (self.activityMonitor, self.simulationActivityMonitor):
+            monitor.setModel(ActivityMonitorModel(['Execution Time', 'Message'], parent=monitor))
+        self.backtestTable.setModel(ActivityMonitorModel(['Execution Time', 'Action'], parent=self.backtestTable))
+
+        # Activity monitor messages get queued and added in batches by this timer instead of one row at a time.
+        self.monitor_queues: Dict[QTableView, List[list]] = defaultdict(list)
+        self.monitor_refresh_timer = QTimer(self)
+        self.monitor_refresh_timer.timeout.connect(self.flush_monitor_queues)
+        self.monitor_refresh_timer.start(MONITOR_REFRESH_INTERVAL_MS)
+
+        # Bot threads only store their latest statistics here; this timer then updates the interface with them. That
+        # way, intermediate statistics are dropped instead of queueing up a signal for every single bot loop.
+        self.latest_stats: Dict[str, Optional[Tuple[dict, dict]]] = {LIVE: None, SIMULATION: None}
+        self.latest_stats_lock = threading.Lock()
+        self.stats_refresh_timer = QTimer(self)
+        self.stats_refresh_timer.timeout.connect(self.update_interface_info_from_latest_stats)
+        self.stats_refresh_timer.start(STATS_REFRESH_INTERVAL_MS)
+
         initiate_slots(app=app, gui=self)  # Initiating slots.
 
         self.interface_dictionary = get_interface_dictionary(self)
@@ -95,7 +173,9 @@ class Interface(QMainWindow):
         self.simulation_lower_interval_data: Union[Data, None] = None
 
         self.telegram_bot: Optional[TelegramBot] = None
+        self.telegram_bot_lock = threading.Lock()  # Held by bot threads while they start the Telegram bot.
         self.tickers = []  # All available tickers.
+        self.ticker_completer: Optional[QCompleter] = None  # Completer with all available tickers.
 
         if algobot.CURRENT_VERSION == UNKNOWN:
             self.add_to_live_activity_monitor("Unknown current version. Try reinstalling Algobot.")
@@ -124,6 +204,20 @@ class Interface(QMainWindow):
         self.graph_update_seconds = 1
         self.graph_update_schedule: List[float or None] = [None, None]  # LIVE, SIM
 
+    def __getattr__(self, name: str):
+        """
+        Creates auxiliary windows the first time they are accessed. This is only called when regular attribute lookup
+        fails, so once a window is created, it's returned directly from the instance dictionary.
+        :param name: Name of attribute being accessed.
+        :return: Auxiliary window requested.
+        """
+        if name in self.LAZY_WINDOWS:
+            window = self.LAZY_WINDOWS[name](self)
+            setattr(self, name, window)
+            return window
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def inform_telegram(self, message: str, stop_bot: bool = False):
         """
         Sends a notification to Telegram if some action is taken by the bot.
@@ -161,7 +255,7 @@ class Interface(QMainWindow):
         news_thread = worker_thread.Worker(scrape_news)
         news_thread.signals.error.connect(self.news_thread_error)
         news_thread.signals.finished.connect(self.setup_news)
-        news_thread.signals.restore.connect(lambda: self.refreshNewsButton.setEnabled(True))
+        news_thread.signals.restore.connect(partial(self.refreshNewsButton.setEnabled, True))
         self.thread_pool.start(news_thread)
 
     def news_thread_error(self, e: str):
@@ -184,7 +278,7 @@ class Interface(QMainWindow):
         ticker_thread = worker_thread.Worker(self.get_tickers)
         ticker_thread.signals.error.connect(self.tickers_thread_error)
         ticker_thread.signals.finished.connect(self.setup_tickers)
-        ticker_thread.signals.restore.connect(lambda: self.configuration.updateTickers.setEnabled(True))
+        ticker_thread.signals.restore.connect(partial(self.configuration.updateTickers.setEnabled, True))
         self.thread_pool.start(ticker_thread)
 
     def tickers_thread_error(self, e: str):
@@ -207,7 +301,8 @@ class Interface(QMainWindow):
         :return: List of all available tickers.
         """
         tickers = [ticker['symbol'] for ticker in Data(load_data=False, log=False).binance_client.get_all_tickers()]
-        return sorted(tickers)
+        tickers.sort()
+        return tickers
 
     def setup_tickers(self, tickers: List[str]):
         """
@@ -228,10 +323,12 @@ class Interface(QMainWindow):
         for widget in ticker_widgets:
             widget.setCompleter(completer)
 
-        full_completer = QCompleter(tickers)
-        full_completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.ticker_completer = QCompleter(tickers)
+        self.ticker_completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
 
-        self.other_commands.csvGenerationTicker.setCompleter(full_completer)
+        # Don't create the other commands window just for this; it picks up the completer when it's created instead.
+        if 'other_commands' in vars(self):
+            self.other_commands.csvGenerationTicker.setCompleter(self.ticker_completer)
         self.configuration.serverResult.setText("Updated tickers successfully.")
 
     def setup_news(self, news: List[str]):
@@ -298,6 +395,7 @@ class Interface(QMainWindow):
         :return: False if not validated and true if validated.
         """
         config = self.configuration
+        config_dict = self.interface_dictionary[caller]['configuration']
         noun = 'optimizer' if caller == OPTIMIZER else 'backtester'
 
         if not self.validate_ticker(caller):
@@ -307,7 +405,7 @@ class Interface(QMainWindow):
             create_popup(self, f"No data setup yet for {noun}. Please download or import data in settings first.")
             return False
 
-        selected_symbol = self.interface_dictionary[caller]['configuration']['ticker'].text()
+        selected_symbol = config_dict['ticker'].text()
         download_symbol = config.optimizer_backtest_dict[caller]['dataType']
 
         if selected_symbol != download_symbol and download_symbol.lower() != 'imported':
@@ -316,7 +414,7 @@ class Interface(QMainWindow):
                                f"or download ({selected_symbol}) data to get rid of this error.")
             return False
 
-        selected_interval = self.interface_dictionary[caller]['configuration']['interval'].currentText().lower()
+        selected_interval = config_dict['interval'].currentText().lower()
         download_interval = config.optimizer_backtest_dict[caller]['dataInterval'].lower()
 
         if selected_interval != download_interval and download_symbol.lower() != 'imported':
@@ -351,14 +449,13 @@ class Interface(QMainWindow):
 
         self.threads[OPTIMIZER] = optimizer_thread.OptimizerThread(gui=self, logger=self.logger, combos=combos)
         worker = self.threads[OPTIMIZER]
-        worker.signals.started.connect(lambda: self.set_optimizer_buttons(running=True, clear=True))
-        worker.signals.restore.connect(lambda: self.set_optimizer_buttons(running=False, clear=False))
-        worker.signals.error.connect(lambda x: create_popup(self, x))
+        worker.signals.started.connect(partial(self.set_optimizer_buttons, running=True, clear=True))
+        worker.signals.restore.connect(partial(self.set_optimizer_buttons, running=False, clear=False))
+        worker.signals.error.connect(partial(create_popup, self))
         if self.configuration.enabledOptimizerNotification.isChecked():
-            worker.signals.finished.connect(lambda: self.inform_telegram('Optimizer has finished running.'))
-        worker.signals.activity.connect(lambda data: add_to_table(self.optimizerTableWidget, data=data,
-                                                                  insert_date=False))
-        self.thread_pool.start(worker)
+            worker.signals.finished.connect(partial(self.inform_telegram, 'Optimizer has finished running.'))
+        worker.signals.activity.connect(partial(add_to_table, self.optimizerTableWidget, insert_date=False))
+        self.long_running_thread_pool.start(worker)
 
     def set_optimizer_buttons(self, running: bool, clear: bool):
         """
@@ -403,10 +500,10 @@ class Interface(QMainWindow):
         worker.signals.activity.connect(self.update_backtest_gui)
         worker.signals.error.connect(self.end_crash_bot_and_create_popup)
         worker.signals.finished.connect(self.end_backtest)
-        worker.signals.message.connect(lambda message: self.add_to_monitor(BACKTEST, message))
-        worker.signals.restore.connect(lambda: self.disable_interface(disable=False, caller=BACKTEST))
-        worker.signals.updateGraphLimits.connect(lambda x: update_backtest_graph_limits(gui=self, limit=x))
-        self.thread_pool.start(worker)
+        worker.signals.message.connect(partial(self.add_to_monitor, BACKTEST))
+        worker.signals.restore.connect(partial(self.disable_interface, disable=False, caller=BACKTEST))
+        worker.signals.updateGraphLimits.connect(partial(update_backtest_graph_limits, self))
+        self.long_running_thread_pool.start(worker)
 
     def end_backtest_thread(self):
         """
@@ -578,15 +675,15 @@ class Interface(QMainWindow):
             return
 
         self.disable_interface(True, caller)
+        self.set_latest_stats(caller, None)  # Don't show statistics from a previous run.
         worker = self.threads[caller] = bot_thread.BotThread(gui=self, caller=caller, logger=self.logger)
-        worker.signals.small_error.connect(lambda x: create_popup(self, x))
+        worker.signals.small_error.connect(partial(create_popup, self))
         worker.signals.error.connect(self.end_crash_bot_and_create_popup)
         worker.signals.activity.connect(self.add_to_monitor)
         worker.signals.started.connect(self.initial_bot_ui_setup)
-        worker.signals.updated.connect(self.update_interface_info)
         worker.signals.progress.connect(self.download_progress_update)
-        worker.signals.add_trade.connect(lambda trade: self.update_trades_table_and_activity_monitor(trade, caller))
-        worker.signals.restore.connect(lambda: self.disable_interface(disable=False, caller=caller))
+        worker.signals.add_trade.connect(partial(self.update_trades_table_and_activity_monitor, caller=caller))
+        worker.signals.restore.connect(partial(self.disable_interface, disable=False, caller=caller))
 
         # All these below are for Telegram.
         worker.signals.force_long.connect(self.force_long)
@@ -597,7 +694,7 @@ class Interface(QMainWindow):
         worker.signals.pause.connect(self.pause_or_resume_bot)
         worker.signals.set_custom_stop_loss.connect(self.set_custom_stop_loss)
         worker.signals.remove_custom_stop_loss.connect(lambda *_args: self.set_custom_stop_loss(caller, False))
-        self.thread_pool.start(worker)
+        self.long_running_thread_pool.start(worker)
 
     def download_progress_update(self, value: int, message: str, caller):
         """
@@ -620,10 +717,11 @@ class Interface(QMainWindow):
         """
         self.disable_interface(True, caller=caller, everything=True)  # Disable everything until everything is done.
         self.enable_override(caller, False)  # Disable overrides.
-        thread = worker_thread.Worker(lambda: self.end_bot_gracefully(caller=caller))
-        thread.signals.error.connect(lambda x: create_popup(self, x))
+        thread = worker_thread.Worker(self.end_bot_gracefully, caller=caller)
+        thread.signals.error.connect(partial(create_popup, self))
+        # Lambdas drop the result emitted by the finished signal.
         thread.signals.finished.connect(lambda: self.add_end_bot_status(caller=caller))
-        thread.signals.restore.connect(lambda: self.reset_bot_interface(caller=caller))
+        thread.signals.restore.connect(partial(self.reset_bot_interface, caller=caller))
         self.thread_pool.start(thread)
 
     def add_end_bot_status(self, caller):
@@ -726,15 +824,9 @@ class Interface(QMainWindow):
         if trader and caller != BACKTEST and not trader.data_view.download_completed:
             self.download_progress_update(value=0, message="Download failed.", caller=caller)
 
-        if '-1021' in msg:
-            msg = msg + ' Please sync your system time.'
-        if 'list index out of range' in msg:
-            pair = self.configuration.tickerLineEdit.text()
-            msg = f'You may not have any assets in the symbol {pair}. Please check Binance and try again.'
-        if 'Chat not found' in msg:
-            msg = "Please check your Telegram bot chat ID or turn off Telegram notifications to get rid of this error."
-        if "Invalid token" in msg:
-            msg = "Please check your Telegram bot token or turn off Telegram integration to get rid of this error."
+        for token, template in CRASH_MESSAGES:
+            if token in msg:
+                msg = template.format(msg=msg, pair=self.configuration.tickerLineEdit.text())
 
         self.create_popup_and_emit_message(caller, msg)
 
@@ -748,8 +840,7 @@ class Interface(QMainWindow):
         if trader_position is not None:
             self.add_to_monitor(caller, f"Detected {trader.get_position_string().lower()} position before bot run.")
         interface_dict = self.interface_dictionary[caller]['mainInterface']
-        self.disable_interface(True, caller, False)
-        self.enable_override(caller)
+        self.enable_override(caller)  # Configuration was already disabled when the bot thread was initiated.
         destroy_graph_plots(self, interface_dict['graph'])
         destroy_graph_plots(self, interface_dict['averageGraph'])
         self.statistics.initialize_tab(trader.get_grouped_statistics(), tab_type=get_caller_string(caller))
@@ -770,13 +861,46 @@ class Interface(QMainWindow):
         :param caller: Caller that determines which configuration settings get disabled.
         """
         disable = not disable
-        self.interface_dictionary[caller]['configuration']['mainTab'].setEnabled(disable)
-        self.interface_dictionary[caller]['mainInterface']['runBotButton'].setEnabled(disable)
+        caller_dict = self.interface_dictionary[caller]
+        main_dict = caller_dict['mainInterface']
+        caller_dict['configuration']['mainTab'].setEnabled(disable)
+        main_dict['runBotButton'].setEnabled(disable)
 
         if everything:
-            self.interface_dictionary[caller]['mainInterface']['endBotButton'].setEnabled(disable)
+            main_dict['endBotButton'].setEnabled(disable)
         else:
-            self.interface_dictionary[caller]['mainInterface']['endBotButton'].setEnabled(not disable)
+            main_dict['endBotButton'].setEnabled(not disable)
+
+    def set_latest_stats(self, caller: str, stats: Optional[Tuple[dict, dict]]):
+        """
+        Sets the latest statistics for the caller provided. This is thread-safe, so bot threads can call it directly.
+        :param caller: Caller the statistics belong to.
+        :param stats: Tuple of the value and grouped dictionaries (as expected by update_interface_info()) or None.
+        """
+        with self.latest_stats_lock:
+            self.latest_stats[caller] = stats
+
+    def has_pending_stats(self, caller: str) -> bool:
+        """
+        Returns whether the caller provided has statistics that haven't been displayed yet. This is thread-safe.
+        :param caller: Caller to check statistics of.
+        :return: Boolean whether there are statistics waiting for the next refresh.
+        """
+        with self.latest_stats_lock:
+            return self.latest_stats[caller] is not None
+
+    def update_interface_info_from_latest_stats(self):
+        """
+        Updates interface elements with the latest statistics of each bot (if any). This is called periodically by the
+        statistics refresh timer.
+        """
+        for caller in self.latest_stats:
+            with self.latest_stats_lock:
+                stats = self.latest_stats[caller]
+                self.latest_stats[caller] = None
+
+            if stats is not None:
+                self.update_interface_info(caller, *stats)
 
     def update_interface_info(self, caller, value_dict: dict, grouped_dict: dict):
         """
@@ -798,13 +922,18 @@ class Interface(QMainWindow):
         :return: None
         """
         main_interface_dictionary = self.interface_dictionary[caller]['mainInterface']
-        main_interface_dictionary['profitLabel'].setText(value_dict['profitLossLabel'])
-        main_interface_dictionary['profitValue'].setText(value_dict['profitLossValue'])
-        main_interface_dictionary['percentageValue'].setText(value_dict['percentageValue'])
-        main_interface_dictionary['netTotalValue'].setText(value_dict['netValue'])
-        main_interface_dictionary['tickerLabel'].setText(value_dict['tickerLabel'])
-        main_interface_dictionary['tickerValue'].setText(value_dict['tickerValue'])
-        main_interface_dictionary['positionValue'].setText(value_dict['currentPositionValue'])
+
+        # Labels all live in the portfolio group box, so we repaint it once after all of them are set.
+        portfolio_group_box = main_interface_dictionary['portfolioGroupBox']
+        portfolio_group_box.setUpdatesEnabled(False)
+        set_text_if_changed(main_interface_dictionary['profitLabel'], value_dict['profitLossLabel'])
+        set_text_if_changed(main_interface_dictionary['profitValue'], value_dict['profitLossValue'])
+        set_text_if_changed(main_interface_dictionary['percentageValue'], value_dict['percentageValue'])
+        set_text_if_changed(main_interface_dictionary['netTotalValue'], value_dict['netValue'])
+        set_text_if_changed(main_interface_dictionary['tickerLabel'], value_dict['tickerLabel'])
+        set_text_if_changed(main_interface_dictionary['tickerValue'], value_dict['tickerValue'])
+        set_text_if_changed(main_interface_dictionary['positionValue'], value_dict['currentPositionValue'])
+        portfolio_group_box.setUpdatesEnabled(True)
 
     def update_main_interface_and_graphs(self, caller: str, value_dict: dict):
         """
@@ -823,15 +952,11 @@ class Interface(QMainWindow):
         Destroys trader based on caller by setting them equal to none.
         :param caller: Caller that determines which trading object gets destroyed.
         """
-        if caller == SIMULATION:
-            self.simulation_trader = None
-        elif caller == LIVE:
-            self.trader = None
-        elif caller == BACKTEST:
-            self.backtester = None
-        else:
+        if caller not in self.TRADER_ATTRIBUTES:
             raise ValueError("invalid caller type specified.")
 
+        setattr(self, self.TRADER_ATTRIBUTES[caller], None)
+
     def handle_custom_stop_loss_buttons(self, caller):
         """
         Handles GUI elements based on current caller's trading position.
@@ -875,8 +1000,9 @@ class Interface(QMainWindow):
         :param enabled: Boolean that determines whether override is enabled or disable. By default, it is enabled.
         :param caller: Caller that will specify which interface will have its override interface enabled.
         """
-        self.interface_dictionary[caller]['mainInterface']['overrideGroupBox'].setEnabled(enabled)
-        self.interface_dictionary[caller]['mainInterface']['customStopLossGroupBox'].setEnabled(enabled)
+        main_dict = self.interface_dictionary[caller]['mainInterface']
+        main_dict['overrideGroupBox'].setEnabled(enabled)
+        main_dict['customStopLossGroupBox'].setEnabled(enabled)
 
     def exit_position_thread(self, caller, human_control: bool):
         """
@@ -916,11 +1042,11 @@ class Interface(QMainWindow):
         :param caller: Caller that will specify which trader will exit position.
         """
         self.add_to_monitor(caller, 'Exiting position...')
-        thread = worker_thread.Worker(lambda: self.exit_position_thread(caller=caller, human_control=human_control))
-        thread.signals.started.connect(lambda: self.enable_override(caller=caller, enabled=False))
+        thread = worker_thread.Worker(self.exit_position_thread, caller=caller, human_control=human_control)
+        thread.signals.started.connect(partial(self.enable_override, caller=caller, enabled=False))
         thread.signals.finished.connect(lambda: self.set_exit_position_gui(caller=caller, human_control=human_control))
-        thread.signals.restore.connect(lambda: self.enable_override(caller=caller, enabled=True))
-        thread.signals.error.connect(lambda x: create_popup(self, x))
+        thread.signals.restore.connect(partial(self.enable_override, caller=caller, enabled=True))
+        thread.signals.error.connect(partial(create_popup, self))
         self.thread_pool.start(thread)
 
     def set_force_long_gui(self, caller):
@@ -950,11 +1076,11 @@ class Interface(QMainWindow):
         :param caller: Caller that will determine with trader will force long.
         """
         self.add_to_monitor(caller, 'Forcing long and stopping autonomous logic...')
-        thread = worker_thread.Worker(lambda: self.force_long_thread(caller=caller))
-        thread.signals.started.connect(lambda: self.enable_override(caller=caller, enabled=False))
+        thread = worker_thread.Worker(self.force_long_thread, caller=caller)
+        thread.signals.started.connect(partial(self.enable_override, caller=caller, enabled=False))
         thread.signals.finished.connect(lambda: self.set_force_long_gui(caller=caller))
-        thread.signals.restore.connect(lambda: self.enable_override(caller=caller, enabled=True))
-        thread.signals.error.connect(lambda x: create_popup(self, x))
+        thread.signals.restore.connect(partial(self.enable_override, caller=caller, enabled=True))
+        thread.signals.error.connect(partial(create_popup, self))
         self.thread_pool.start(thread)
 
     def set_force_short_gui(self, caller):
@@ -984,11 +1110,11 @@ class Interface(QMainWindow):
         :param caller: Caller that will determine with trader will force short.
         """
         self.add_to_monitor(caller, 'Forcing short and stopping autonomous logic...')
-        thread = worker_thread.Worker(lambda: self.force_short_thread(caller=caller))
-        thread.signals.started.connect(lambda: self.enable_override(caller=caller, enabled=False))
+        thread = worker_thread.Worker(self.force_short_thread, caller=caller)
+        thread.signals.started.connect(partial(self.enable_override, caller=caller, enabled=False))
         thread.signals.finished.connect(lambda: self.set_force_short_gui(caller=caller))
-        thread.signals.restore.connect(lambda: self.enable_override(caller=caller, enabled=True))
-        thread.signals.error.connect(lambda x: create_popup(self, x))
+        thread.signals.restore.connect(partial(self.enable_override, caller=caller, enabled=True))
+        thread.signals.error.connect(partial(create_popup, self))
         self.thread_pool.start(thread)
 
     def modify_override_buttons(self,
@@ -1076,12 +1202,15 @@ class Interface(QMainWindow):
         :param trade: Trade information to add.
         """
         row_position = table.rowCount()
-        columns = table.columnCount()
+        items = [QTableWidgetItem(str(trade[column])) for column in range(table.columnCount())]
 
-        table.insertRow(row_position)
-        for column in range(columns):
-            cell = QTableWidgetItem(str(trade[column]))
-            table.setItem(row_position, column, cell)
+        table.setUpdatesEnabled(False)
+        try:
+            table.insertRow(row_position)
+            for column, item in enumerate(items):
+                table.setItem(row_position, column, item)
+        finally:
+            table.setUpdatesEnabled(True)
 
     def get_activity_table(self, caller):
         """
@@ -1089,53 +1218,61 @@ class Interface(QMainWindow):
         :param caller: Caller enum.
         :return: Activity table for the caller.
         """
-        if caller == LIVE:
-            return self.activityMonitor
-        elif caller == SIMULATION:
-            return self.simulationActivityMonitor
-        elif caller == BACKTEST:
-            return self.backtestTable
-        else:
+        if caller not in self.ACTIVITY_MONITOR_ATTRIBUTES:
             raise ValueError("Invalid type of caller specified.")
 
+        return getattr(self, self.ACTIVITY_MONITOR_ATTRIBUTES[caller])
+
     def add_to_monitor(self, caller: str, message: str):
         """
         Adds message to the monitor based on caller.
         :param caller: Caller that determines which table gets the message.
         :param message: Message to be added.
         """
-        if caller == SIMULATION:
-            self.add_to_simulation_activity_monitor(message)
-        elif caller == LIVE:
-            self.add_to_live_activity_monitor(message)
-        elif caller == BACKTEST:
-            self.add_to_backtest_monitor(message)
-        else:
+        if caller not in self.ACTIVITY_MONITOR_ATTRIBUTES:
             raise TypeError("Invalid type of caller specified.")
 
+        self.queue_monitor_message(getattr(self, self.ACTIVITY_MONITOR_ATTRIBUTES[caller]), message)
+
     def add_to_backtest_monitor(self, message: str):
         """
         Function that adds activity information to the backtest activity monitor.
         :param message: Message to add to backtest activity log.
         """
-        add_to_table(self.backtestTable, [message])
-        self.backtestTable.scrollToBottom()
+        self.queue_monitor_message(self.backtestTable, message)
 
     def add_to_simulation_activity_monitor(self, message: str):
         """
         Function that adds activity information to the simulation activity monitor.
         :param message: Message to add to simulation activity log.
         """
-        add_to_table(self.simulationActivityMonitor, [message])
-        self.simulationActivityMonitor.scrollToBottom()
+        self.queue_monitor_message(self.simulationActivityMonitor, message)
 
     def add_to_live_activity_monitor(self, message: str):
         """
         Function that adds activity information to activity monitor.
         :param message: Message to add to activity log.
         """
-        add_to_table(self.activityMonitor, [message])
-        self.activityMonitor.scrollToBottom()
+        self.queue_monitor_message(self.activityMonitor, message)
+
+    def queue_monitor_message(self, monitor: QTableView, message: str):
+        """
+        Queues message to be added to the activity monitor provided on the next monitor refresh. The date is captured
+        now, so it reflects when the message was created rather than when it was displayed.
+        :param monitor: Activity monitor table to add message to.
+        :param message: Message to add to activity log.
+        """
+        self.monitor_queues[monitor].append([get_current_time_string(), message])
+
+    def flush_monitor_queues(self):
+        """
+        Adds all queued messages to their activity monitors. This is called periodically by the monitor refresh timer.
+        """
+        for monitor, rows in self.monitor_queues.items():
+            if rows:
+                monitor.model().add_rows(rows)
+                rows.clear()
+                monitor.scrollToBottom()
 
     def update_trades_table_and_activity_monitor(self, trade: dict, caller):
         """
@@ -1144,12 +1281,10 @@ class Interface(QMainWindow):
         :param trade: Trade information to add to activity monitor and trades table.
         :param caller: Caller object that will rule which tables get updated.
         """
-        table = self.interface_dictionary[caller]['mainInterface']['historyTable']
-        trader = self.get_trader(caller)
-
-        if not trader:
+        if not self.get_trader(caller):
             return
 
+        table = self.interface_dictionary[caller]['mainInterface']['historyTable']
         trade_data = [trade['orderID'],
                       trade['pair'],
                       trade['price'],
@@ -1164,8 +1299,6 @@ class Interface(QMainWindow):
         if caller == LIVE and self.telegram_bot and self.configuration.enableTelegramSendMessage.isChecked():
             self.inform_telegram(message=trade['action'])
 
-        monitor = self.get_activity_table(caller=caller)
-        monitor.scrollToBottom()
         table.scrollToBottom()
 
     def closeEvent(self, event):  # pylint:disable=invalid-name
@@ -1243,7 +1376,7 @@ class Interface(QMainWindow):
         if self.trader is not None:
             thread = worker_thread.Worker(self.trader.retrieve_margin_values)
             thread.signals.finished.connect(lambda: create_popup(self, 'Successfully updated values.'))
-            thread.signals.error.connect(lambda x: create_popup(self, x))
+            thread.signals.error.connect(partial(create_popup, self))
             self.thread_pool.start(thread)
         else:
             create_popup(self, 'There is currently no live bot running.')
@@ -1344,10 +1477,8 @@ class Interface(QMainWindow):
 
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                rows = f.readlines()
-                for row in rows:
-                    row = row.strip().split(',')
-                    add_to_table(table, row, insert_date=False)
+                rows = [row.strip().split(',') for row in f.readlines()]
+            add_rows_to_table(table, rows)
             label.setText("Imported trade history successfully.")
         except Exception as e:
             label.setText("Could not import trade history due to data corruption or no file being selected.")
@@ -1368,28 +1499,22 @@ class Interface(QMainWindow):
         :param caller: Caller that determines which lower interval data object gets returned.
         :return: Data object.
         """
-        if caller == SIMULATION:
-            return self.simulation_lower_interval_data
-        elif caller == LIVE:
-            return self.lower_interval_data
-        else:
+        if caller not in self.LOWER_INTERVAL_DATA_ATTRIBUTES:
             raise TypeError("Invalid type of caller specified.")
 
+        return getattr(self, self.LOWER_INTERVAL_DATA_ATTRIBUTES[caller])
+
     def get_trader(self, caller: str) -> Union[SimulationTrader, Backtester]:
         """
         Returns a trader object.
         :param caller: Caller that decides which trader object gets returned.
         :return: Trader object.
         """
-        if caller == SIMULATION:
-            return self.simulation_trader
-        elif caller == LIVE:
-            return self.trader
-        elif caller == BACKTEST:
-            return self.backtester
-        else:
+        if caller not in self.TRADER_ATTRIBUTES:
             raise TypeError("Invalid type of caller specified.")
 
+        return getattr(self, self.TRADER_ATTRIBUTES[caller])
+
 
 def main():
     """
@@ -37,6 +37,7 @@ def get_interface_dictionary(parent, caller: str = None):
                 'disableCustomStopLossButton': parent.disableSimulationCustomStopLossButton,
                 # Groupboxes
                 'overrideGroupBox': parent.simulationOverrideGroupBox,
+                'portfolioGroupBox': parent.simulationPortfolioGroupBox,
                 'customStopLossGroupBox': parent.customSimulationStopLossGroupBox,
                 # Graphs
                 'graph': parent.simulationGraph,
@@ -78,6 +79,7 @@ def get_interface_dictionary(parent, caller: str = None):
                 'disableCustomStopLossButton': parent.disableCustomStopLossButton,
                 # Groupboxes
                 'overrideGroupBox': parent.overrideGroupBox,
+                'portfolioGroupBox': parent.portfolioGroupBox,
                 'customStopLossGroupBox': parent.customStopLossGroupBox,
                 # Graphs
                 'graph': parent.liveGraph,
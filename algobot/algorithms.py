@@ -124,17 +124,18 @@ def get_ema(data: List[dict], prices: int, parameter: str, sma_prices: int = 5,
         sma_prices = len(data) - 1
 
     multiplier = 2 / (prices + 1)
+    decay = 1 - multiplier
 
     if memo and prices in memo and parameter in memo[prices]:
         index = 0 if desc else -1
         current_price = get_data_from_parameter(data[index], parameter)
         if memo[prices][parameter][-1][1] == data[index]['date_utc']:
             previous_ema = memo[prices][parameter][-2][0]
-            ema = current_price * multiplier + previous_ema * (1 - multiplier)
+            ema = current_price * multiplier + previous_ema * decay
             memo[prices][parameter][-1][0] = ema
         elif memo[prices][parameter][-1][1] < data[index]['date_utc']:
             previous_ema = memo[prices][parameter][-1][0]
-            ema = current_price * multiplier + previous_ema * (1 - multiplier)
+            ema = current_price * multiplier + previous_ema * decay
             memo[prices][parameter].append([ema, data[index]['date_utc']])
         else:
             raise ValueError("Something went wrong in the calculation of the EMA.")
@@ -153,8 +154,7 @@ def get_ema(data: List[dict], prices: int, parameter: str, sma_prices: int = 5,
             data = data[sma_prices:]
 
         for period in data:
-            current_price = get_data_from_parameter(period, parameter=parameter)
-            ema = current_price * multiplier + ema * (1 - multiplier)
+            ema = get_data_from_parameter(period, parameter) * multiplier + ema * decay
             values.append([ema, period['date_utc']])
 
         if not memo:
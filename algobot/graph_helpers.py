@@ -4,9 +4,12 @@ File containing helper functions for graphs.
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
+import numpy as np
+from PyQt5.QtGui import QPen
 from PyQt5.QtWidgets import QColorDialog, QDialog, QLabel
 from pyqtgraph import InfiniteLine, PlotWidget, mkPen
 
@@ -15,6 +18,10 @@ from algobot.interface.utils import show_and_bring_window_to_front
 from algobot.traders.trader import Trader
 
 GRAPH_LEEWAY = 10  # Amount of points to set extra for graph limits.
+PLOT_BUFFER_SIZE = 1024  # Initial capacity of plot buffers. Buffers are doubled whenever they fill up.
+MAX_PLOT_POINTS = 86400  # Reset graph every 24 hours (assuming data is updated only once a second).
+PLOT_REFRESH_INTERVAL_MS = 33  # Minimum amount of milliseconds between plot redraws (~30 redraws a second).
+PENS: Dict[str, QPen] = {}  # Plot pens by color, so recreated plots don't parse their color again.
 
 if TYPE_CHECKING:
     from algobot.__main__ import Interface
@@ -49,14 +56,12 @@ def set_backtest_graph_limits_and_empty_plots(gui: Interface, limit: int = 105):
     :param gui: Graphical user interface in which to set up graphs.
     :param limit: Maximum x-axis limit to set in the graph.
     """
-    initial_timestamp = gui.backtester.data[0]['date_utc'].timestamp()
+    initial_timestamp = gui.backtester.data_timestamp_range[0]
     graph_dict = get_graph_dictionary(gui, gui.backtestGraph)
     graph_dict['graph'].setLimits(xMin=0, xMax=limit)
     plot = graph_dict['plots'][0]
-    plot['x'] = [0]
-    plot['y'] = [gui.backtester.starting_balance]
-    plot['z'] = [initial_timestamp]
-    plot['plot'].setData(plot['x'], plot['y'])
+    reset_plot_buffers(plot, y=gui.backtester.starting_balance, timestamp=initial_timestamp)
+    plot['plot'].setData(get_plot_values(plot, 'x'), get_plot_values(plot, 'y'))
 
 
 def update_backtest_graph_limits(gui: Interface, limit: int = 105):
@@ -71,14 +76,40 @@ def update_backtest_graph_limits(gui: Interface, limit: int = 105):
 
 def get_graph_dictionary(gui: Interface, target_graph: PlotWidget) -> dict:
     """
-    Loops over list of graphs and returns appropriate graph dictionary.
+    Returns appropriate graph dictionary from the GUI's graph widget mapping.
     :param gui: Graphical user interface in which to set up graphs.
     :param target_graph: Graph to find in list of graphs.
     :return: Dictionary with the graph values.
     """
-    for graph in gui.graphs:
-        if graph["graph"] == target_graph:
-            return graph
+    return gui.graph_dicts.get(target_graph)
+
+
+def reset_plot_buffers(plot: dict, y: float, timestamp: float):
+    # pylint: disable=invalid-name
+    """
+    Resets plot buffers to a single point with the values provided. Buffers are only allocated the first time; later
+    resets reuse them and just rewind the size counter.
+    :param plot: Plot dictionary to reset buffers of.
+    :param y: Y value to start with for plot.
+    :param timestamp: First UTC timestamp of plot.
+    """
+    if 'x' not in plot:
+        plot['x'] = np.empty(PLOT_BUFFER_SIZE, dtype=np.float64)
+        plot['y'] = np.empty(PLOT_BUFFER_SIZE, dtype=np.float64)
+        plot['z'] = np.empty(PLOT_BUFFER_SIZE, dtype=np.float64)
+
+    plot['x'][0], plot['y'][0], plot['z'][0] = 0, y, timestamp
+    plot['size'] = 1
+
+
+def get_plot_values(plot: dict, key: str) -> np.ndarray:
+    """
+    Returns a view of the populated portion of a plot buffer.
+    :param plot: Plot dictionary to get values from.
+    :param key: Buffer to get values of (x, y, or z).
+    :return: View of buffer with only the populated values.
+    """
+    return plot[key][:plot['size']]
 
 
 def legend_helper(graph_dict, x_val):
@@ -88,11 +119,11 @@ def legend_helper(graph_dict, x_val):
     :param x_val: X value in the graph.
     """
     legend = graph_dict['graph'].plotItem.legend.items
-    date_object = datetime.utcfromtimestamp(graph_dict['plots'][0]['z'][x_val])
+    date_object = datetime.utcfromtimestamp(get_plot_values(graph_dict['plots'][0], 'z')[x_val])
     total = f'X: {x_val} Datetime in UTC: {date_object.strftime("%m/%d/%Y, %H:%M:%S")}'
 
     for index, plot_dict in enumerate(graph_dict['plots']):
-        info = f' {plot_dict["name"]}: {plot_dict["y"][x_val]}'
+        info = f' {plot_dict["name"]}: {get_plot_values(plot_dict, "y")[x_val]}'
         total += info
         legend[index][1].setText(info)  # The 2nd element in legend is the label, so we can just set text.
 
@@ -126,7 +157,8 @@ def on_mouse_moved(gui: Interface, point, graph: PlotWidget):
     elif graph_dict['enable'] and point and graph_dict.get('line'):  # Ensure that the hover line is enabled.
         graph_dict['line'].setPos(x_val)
 
-        if graph_dict['plots'][0]['x'][-1] > x_val > graph_dict['plots'][0]['x'][0]:
+        x_values = get_plot_values(graph_dict['plots'][0], 'x')
+        if x_values[-1] > x_val > x_values[0]:
             legend_helper(graph_dict, int(x_val))
             if graph == gui.backtestGraph and gui.backtester is not None:
                 gui.update_backtest_activity_based_on_graph(int(x_val))
@@ -146,19 +178,56 @@ def add_data_to_plot(gui: Interface,
     :param y: Y value to add.
     :param timestamp: Timestamp value to add.
     """
-    graph_dict = get_graph_dictionary(gui, target_graph=target_graph)
-    plot = graph_dict['plots'][plot_index]
+    add_data_to_plots(gui, target_graph, [(plot_index, y)], timestamp=timestamp)
 
-    seconds_in_day = 86400  # Reset graph every 24 hours (assuming data is updated only once a second).
-    if len(plot['x']) >= seconds_in_day:
-        plot['x'] = [0]
-        plot['y'] = [y]
-        plot['z'] = [timestamp]
-    else:
-        plot['x'].append(plot['x'][-1] + 1)
-        plot['y'].append(y)
-        plot['z'].append(timestamp)
-    plot['plot'].setData(plot['x'], plot['y'])
+
+def add_data_to_plots(gui: Interface,
+                      target_graph: PlotWidget,
+                      updates: List[Tuple[int, float]],
+                      timestamp: float):
+    """
+    Adds data to multiple plots in provided graph with a single graph lookup. All plots share the same timestamp.
+    :param gui: Graphical user interface in which to set up graphs.
+    :param target_graph: Graph to use for plots to add data to.
+    :param updates: List of tuples containing the plot index in target graph's list of plots and the Y value to add.
+    :param timestamp: Timestamp value to add.
+    """
+    plots = get_graph_dictionary(gui, target_graph=target_graph)['plots']
+    dirty_plots = gui.dirty_plots
+
+    for plot_index, y in updates:  # pylint: disable=invalid-name
+        plot = plots[plot_index]
+        size = plot['size']
+
+        if size >= MAX_PLOT_POINTS:
+            reset_plot_buffers(plot, y=y, timestamp=timestamp)
+        else:
+            if size == len(plot['x']):  # Buffers are full, so double their capacity.
+                for key in ('x', 'y', 'z'):
+                    plot[key] = np.resize(plot[key], size * 2)
+
+            plot['x'][size] = plot['x'][size - 1] + 1
+            plot['y'][size] = y
+            plot['z'][size] = timestamp
+            plot['size'] = size + 1
+
+        dirty_plots[id(plot)] = plot  # Plot will get redrawn on the next refresh.
+
+
+def refresh_dirty_plots(gui: Interface):
+    """
+    Redraws all plots that received new data since the last refresh. This is called periodically by the GUI's plot
+    refresh timer, so multiple data points added between refreshes only trigger one redraw per plot. Plots of hidden
+    graphs (e.g. in inactive tabs) stay dirty until their graph is shown again.
+    :param gui: Graphical user interface in which to refresh plots.
+    """
+    if not gui.dirty_plots:
+        return
+
+    for plot_id, plot in list(gui.dirty_plots.items()):
+        if plot['graph'].isVisible():
+            plot['plot'].setData(get_plot_values(plot, 'x'), get_plot_values(plot, 'y'))
+            del gui.dirty_plots[plot_id]
 
 
 def setup_graph_plots(gui: Interface,
@@ -176,18 +245,26 @@ def setup_graph_plots(gui: Interface,
     if gui.configuration.enableHoverLine.isChecked():
         create_infinite_line(gui, get_graph_dictionary(gui, graph), colors=colors)
 
-    if graph_type == GraphType.NET:
-        setup_net_graph_plot(gui, graph=graph, trader=trader, color=colors[0])
-    elif graph_type == GraphType.AVG:
-        setup_average_graph_plots(gui, graph=graph, trader=trader, colors=colors)
-    else:
-        raise TypeError(f"Invalid type ({graph_type}) of graph provided.")
+    # Adding each plot would otherwise recompute the graph's range, so it's only done once after all plots are added.
+    view_box = graph.getPlotItem().getViewBox()
+    auto_range_x, auto_range_y = view_box.autoRangeEnabled()
+    view_box.disableAutoRange()
+    try:
+        if graph_type == GraphType.NET:
+            setup_net_graph_plot(gui, graph=graph, trader=trader, color=colors[0])
+        elif graph_type == GraphType.AVG:
+            setup_average_graph_plots(gui, graph=graph, trader=trader, colors=colors)
+        else:
+            raise TypeError(f"Invalid type ({graph_type}) of graph provided.")
+    finally:
+        view_box.enableAutoRange(x=auto_range_x, y=auto_range_y)
 
 
 def get_plot_dictionary(gui: Interface, graph: PlotWidget, color: str, y: float, name: str, timestamp: float) -> dict:
     # pylint: disable=invalid-name
     """
-    Creates a graph plot and returns a dictionary of it.
+    Creates a graph plot and returns a dictionary of it. If the graph has spare plots left over from
+    destroy_graph_plots(), one of them gets reused instead of creating a new one.
     :param gui: Graphical user interface in which to set up graphs.
     :param graph: Graph to add plot to.
     :param color: Color of plot.
@@ -196,24 +273,51 @@ def get_plot_dictionary(gui: Interface, graph: PlotWidget, color: str, y: float,
     :param timestamp: First UTC timestamp of plot.
     :return: Dictionary of plot information.
     """
-    plot = create_graph_plot(gui, graph, (0,), (y,), color=color, plot_name=name)
-    return {
-        'plot': plot,
-        'x': [0],
-        'y': [y],
-        'z': [timestamp],
-        'name': name,
-    }
+    spare_plots = get_graph_dictionary(gui, target_graph=graph).setdefault('spare_plots', [])
+    if not spare_plots:
+        plot_dict = {
+            'name': name,
+            'graph': graph,
+        }
+        reset_plot_buffers(plot_dict, y=y, timestamp=timestamp)
+        x_values, y_values = get_plot_values(plot_dict, 'x'), get_plot_values(plot_dict, 'y')
+        plot_dict['plot'] = create_graph_plot(gui, graph, x_values, y_values, color=color, plot_name=name)
+        return plot_dict
+
+    plot_dict = spare_plots.pop()
+    plot_dict['name'] = name
+    reset_plot_buffers(plot_dict, y=y, timestamp=timestamp)
+
+    plot = plot_dict['plot']
+    plot.opts['name'] = name
+    plot.setPen(get_pen(color))
+    plot.setData(get_plot_values(plot_dict, 'x'), get_plot_values(plot_dict, 'y'))
+    plot.show()
+    graph.plotItem.legend.addItem(plot, name)
+    return plot_dict
 
 
 def destroy_graph_plots(gui: Interface, target_graph: PlotWidget):
     """
-    Resets graph plots for graph provided.
+    Resets graph plots for graph provided. Plots are hidden and removed from the legend, but stay in the graph as
+    spares, so that the next plots set up in this graph can reuse them (along with their buffers) instead of creating
+    new ones.
     :param gui: Graphical user interface in which to set up graphs.
     :param target_graph: Graph to destroy plots for.
     """
     graph_dict = get_graph_dictionary(gui, target_graph=target_graph)
-    graph_dict['graph'].clear()
+    graph = graph_dict['graph']
+
+    if graph_dict.get('line') is not None:
+        graph.removeItem(graph_dict.pop('line'))
+
+    for plot in graph_dict['plots']:
+        gui.dirty_plots.pop(id(plot), None)
+        graph.plotItem.legend.removeItem(plot['plot'])
+        plot['plot'].hide()
+
+    # Reversed, so that popping spares off the end reuses them in their original order.
+    graph_dict.setdefault('spare_plots', []).extend(reversed(graph_dict['plots']))
     graph_dict['plots'] = []
 
 
@@ -226,7 +330,7 @@ def setup_net_graph_plot(gui: Interface, graph: PlotWidget, trader: Trader, colo
     :param color: Color plot will be setup in.
     """
     net = trader.starting_balance
-    current_date_timestamp = datetime.utcnow().timestamp()
+    current_date_timestamp = time.time()
     plot = get_plot_dictionary(gui, graph=graph, color=color, y=net, name='Net', timestamp=current_date_timestamp)
 
     append_plot_to_graph(gui, graph, [plot])
@@ -244,7 +348,7 @@ def setup_average_graph_plots(gui: Interface, graph: PlotWidget, trader, colors:
         trader.current_price = trader.data_view.get_current_price()
 
     current_price = trader.current_price
-    current_date_timestamp = datetime.utcnow().timestamp()
+    current_date_timestamp = time.time()
 
     ticker_plot_dict = get_plot_dictionary(gui=gui,
                                            graph=graph,
@@ -301,7 +405,7 @@ def create_infinite_line(gui: Interface, graph_dict: dict, colors: list = None):
     graph_dict['line'] = hover_line
 
 
-def create_graph_plot(gui: Interface, graph: PlotWidget, x: tuple, y: tuple, plot_name: str, color: str):
+def create_graph_plot(gui: Interface, graph: PlotWidget, x: np.ndarray, y: np.ndarray, plot_name: str, color: str):
     # pylint: disable=invalid-name
     """
     Creates a graph plot with parameters provided.
@@ -312,12 +416,25 @@ def create_graph_plot(gui: Interface, graph: PlotWidget, x: tuple, y: tuple, plo
     :param plot_name: Name of graph.
     :param color: Color graph will be drawn in.
     """
-    pen = mkPen(color=color)
-    plot = graph.plot(x, y, name=plot_name, pen=pen, autoDownsample=True, downsampleMethod='subsample')
+    # Downsampling is set in setup_graphs().
+    plot = graph.plot(x, y, name=plot_name, pen=get_pen(color), skipFiniteCheck=True)
     plot.curve.scene().sigMouseMoved.connect(lambda point: on_mouse_moved(gui=gui, point=point, graph=graph))
     return plot
 
 
+def get_pen(color: str) -> QPen:
+    """
+    Returns pen of color provided for plots. Pens are created once per color and then shared, as plots copy the pen
+    they are given.
+    :param color: Color of pen.
+    :return: Pen of color provided.
+    """
+    pen = PENS.get(color)
+    if pen is None:
+        pen = PENS[color] = mkPen(color=color)
+    return pen
+
+
 def get_graph_colors(gui: Interface) -> List[str]:
     """
     Returns graph colors to be placed based on configuration.
@@ -333,24 +450,28 @@ def setup_graphs(gui: Interface):
     Sets up all available graphs in application.
     :param gui: Graphical user interface in which to set up graphs.
     """
+    titles = {
+        gui.backtestGraph: "Backtest Net",
+        gui.simulationGraph: "Simulation Net",
+        gui.liveGraph: "Live Net",
+        gui.simulationAvgGraph: "Simulation Indicators",
+        gui.avgGraph: "Live Indicators",
+    }
+
     for graph_dict in gui.graphs:
         graph = graph_dict['graph']
         graph.setLimits(xMin=0, xMax=GRAPH_LEEWAY, yMin=-1, yMax=1000_000_000_000_000)
-        graph.setBackground('w')
+        graph.setBackground(gui.graph_background)
         graph.setLabel('left', 'USDT')
         graph.setLabel('bottom', 'Data Points')
         graph.addLegend()
 
-        if graph == gui.backtestGraph:
-            graph.setTitle("Backtest Net")
-        elif graph == gui.simulationGraph:
-            graph.setTitle("Simulation Net")
-        elif graph == gui.liveGraph:
-            graph.setTitle("Live Net")
-        elif graph == gui.simulationAvgGraph:
-            graph.setTitle("Simulation Indicators")
-        elif graph == gui.avgGraph:
-            graph.setTitle("Live Indicators")
+        # Only draw what's in view and decimate it to the viewport's width. Plots added later inherit these settings.
+        graph.setDownsampling(auto=True, mode='peak')
+        graph.setClipToView(True)
+
+        if graph in titles:
+            graph.setTitle(titles[graph])
 
 
 def smart_update(graph_dict: Dict[str, Any]):
@@ -376,14 +497,14 @@ def update_main_graphs(gui: Interface, caller: str, value_dict: dict):
     :param caller: Caller that decides which graphs get updated.
     """
     precision = gui.get_trader(caller=caller).precision
-    interface_dict = gui.interface_dictionary[caller]
-    current_utc = datetime.utcnow().timestamp()
+    main_interface_dict = gui.interface_dictionary[caller]['mainInterface']
+    current_utc = time.time()
 
-    net_graph = interface_dict['mainInterface']['graph']
-    average_graph = interface_dict['mainInterface']['averageGraph']
+    net_graph = main_interface_dict['graph']
+    average_graph = main_interface_dict['averageGraph']
 
     graph_dict = get_graph_dictionary(gui, net_graph)
-    graph_x_size = len(graph_dict['plots'][0]['x']) + GRAPH_LEEWAY
+    graph_x_size = graph_dict['plots'][0]['size'] + GRAPH_LEEWAY
     net_graph.setLimits(xMin=0, xMax=graph_x_size)
     add_data_to_plot(gui, net_graph, 0, y=round(value_dict['net'], 2), timestamp=current_utc)
     smart_update(graph_dict)
@@ -391,7 +512,7 @@ def update_main_graphs(gui: Interface, caller: str, value_dict: dict):
     average_graph_dict = get_graph_dictionary(gui, average_graph)
     if average_graph_dict['enable']:
         average_graph.setLimits(xMin=0, xMax=graph_x_size)
-        add_data_to_plot(gui, average_graph, 0, y=round(value_dict['price'], precision), timestamp=current_utc)
+        updates = [(0, round(value_dict['price'], precision))]
 
         trader = gui.get_trader(caller=caller)
         for strategy in trader.strategies.values():
@@ -403,12 +524,8 @@ def update_main_graphs(gui: Interface, caller: str, value_dict: dict):
                     continue
 
                 value, _ = combined_data
-                add_data_to_plot(
-                    gui=gui,
-                    target_graph=average_graph,
-                    plot_index=index,
-                    y=round(value, trader.precision),
-                    timestamp=current_utc
-                )
+                updates.append((index, round(value, trader.precision)))
                 index += 1
+
+        add_data_to_plots(gui, average_graph, updates, timestamp=current_utc)
         smart_update(average_graph_dict)
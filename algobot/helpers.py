@@ -6,10 +6,8 @@ import json
 import logging
 import math
 import os
-import platform
 import random
 import re
-import subprocess
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Union
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Union
 import pandas as pd
 import requests
 from dateutil import parser
+from PyQt5.QtCore import QUrl
+from PyQt5.QtGui import QDesktopServices
 
 import algobot
 from algobot.typing_hints import DictType
@@ -171,16 +171,11 @@ def create_folder_if_needed(target_path: str, base_path: str = ROOT_DIR) -> bool
 
 def open_file_or_folder(target_path: str):
     """
-    Opens a file or folder based on targetPath.
+    Opens a file or folder based on targetPath. This hands the path off to the desktop environment without waiting on
+    it, so the GUI thread isn't blocked while the file or folder is being opened.
     :param target_path: File or folder to open with system defaults.
     """
-    # pylint: disable=consider-using-with, no-member
-    if platform.system() == "Windows":
-        os.startfile(target_path)
-    elif platform.system() == "Darwin":
-        subprocess.Popen(["open", target_path])
-    else:
-        subprocess.Popen(["xdg-open", target_path])
+    QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.abspath(target_path)))
 
 
 def setup_and_return_log_path(file_name: str) -> str:
@@ -459,8 +454,15 @@ def convert_all_dates_to_datetime(data: List[Dict[str, Union[float, str, datetim
     if isinstance(data[0]['date_utc'], datetime):
         return
 
-    for entry in data:
-        entry['date_utc'] = parser.parse(entry['date_utc'])
+    dates = [entry['date_utc'] for entry in data]
+    try:
+        # Parsing all dates in one batch is much faster than parsing them one by one.
+        parsed_dates = pd.to_datetime(dates).to_pydatetime()
+    except (ValueError, TypeError):  # Dates aren't all in the same format, so fall back to parsing them one by one.
+        parsed_dates = [parser.parse(date) for date in dates]
+
+    for entry, parsed_date in zip(data, parsed_dates):
+        entry['date_utc'] = parsed_date
 
 
 def load_from_csv(path: str, descending: bool = True) -> List[Dict[str, Union[float, str]]]:
@@ -471,17 +473,16 @@ def load_from_csv(path: str, descending: bool = True) -> List[Dict[str, Union[fl
     :return: List of dictionaries containing open, high, low, close, and date information.
     """
     df = pd.read_csv(path)
-    df.columns = [col.lower().strip() for col in df.columns]  # To support backwards compatibility.
-    data = df.to_dict('records')  # pylint: disable=no-member
+    columns = [col.lower().strip() for col in df.columns]  # To support backwards compatibility.
+    # Zipping whole columns is much faster than letting Pandas box every value into records one row at a time.
+    data = [dict(zip(columns, row)) for row in zip(*(df[col].tolist() for col in df.columns))]
 
     first_date = parser.parse(data[0]['date_utc'])  # Retrieve first date from CSV data.
     last_date = parser.parse(data[-1]['date_utc'])  # Retrieve last date from CSV data.
 
-    if descending and first_date < last_date:
-        return data[::-1]
-
-    if not descending and first_date > last_date:
-        return data[::-1]
+    # Data is a new list, so it can be reversed in place instead of being copied.
+    if (descending and first_date < last_date) or (not descending and first_date > last_date):
+        data.reverse()
 
     return data
 
@@ -0,0 +1,72 @@
+"""
+Table model for activity monitors in the GUI.
+"""
+
+from typing import Any, List
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+
+class ActivityMonitorModel(QAbstractTableModel):
+    """
+    Append-only table model for activity monitors. Rows are kept as plain Python lists, so adding rows doesn't create
+    a table widget item per cell like a QTableWidget does.
+    """
+    def __init__(self, headers: List[str], parent: QObject = None):
+        super(ActivityMonitorModel, self).__init__(parent)
+        self.headers = headers
+        self.rows: List[list] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # pylint: disable=invalid-name
+        """
+        Returns amount of rows in the model.
+        """
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # pylint: disable=invalid-name
+        """
+        Returns amount of columns in the model.
+        """
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """
+        Returns the data to display at the index provided.
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return str(self.rows[index.row()][index.column()])
+
+    def headerData(self, section: int, orientation: Qt.Orientation,  # pylint: disable=invalid-name
+                   role: int = Qt.DisplayRole) -> Any:
+        """
+        Returns the header labels of the model.
+        """
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        return self.headers[section]
+
+    def add_rows(self, rows: List[list]):
+        """
+        Adds rows provided to the end of the model in one batch.
+        :param rows: List of rows (with each row being a list of data) to add.
+        """
+        if not rows:
+            return
+
+        for row in rows:
+            if len(row) != len(self.headers):
+                raise ValueError('Data needs to have the same amount of columns as table.')
+
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        """
+        Removes all rows from the model.
+        """
+        self.beginResetModel()
+        self.rows = []
+        self.endResetModel()
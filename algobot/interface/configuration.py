@@ -8,20 +8,19 @@ import os
 from logging import Logger
 from typing import TYPE_CHECKING
 
-from PyQt5 import uic
 from PyQt5.QtCore import QThreadPool
 from PyQt5.QtWidgets import (QCheckBox, QComboBox, QDialog, QDoubleSpinBox, QLabel, QLayout, QSpinBox, QTabWidget,
                              QWidget)
 
 from algobot.enums import ALL_TRENDS, BACKTEST, LIVE, OPTIMIZER, SIMULATION, STOP, TRAILING
-from algobot.graph_helpers import create_infinite_line
+from algobot.graph_helpers import create_infinite_line, get_graph_colors
 from algobot.helpers import ROOT_DIR
 from algobot.interface.config_utils.credential_utils import load_credentials
 from algobot.interface.config_utils.slot_utils import load_hide_show_strategies, load_slots
 from algobot.interface.configuration_helpers import (add_start_end_step_to_layout, get_default_widget,
                                                      get_input_widget_value)
 # noinspection PyUnresolvedReferences
-from algobot.interface.utils import clear_layout, get_elements_from_combobox
+from algobot.interface.utils import clear_layout, get_elements_from_combobox, load_ui
 from algobot.strategies import *  # noqa: F403, F401 pylint: disable=wildcard-import,unused-wildcard-import
 from algobot.strategies.loader import get_json_strategies
 
@@ -37,7 +36,7 @@ class Configuration(QDialog):
     """
     def __init__(self, parent: Interface, logger: Logger = None):
         super(Configuration, self).__init__(parent)  # Initializing object
-        uic.loadUi(configurationUi, self)  # Loading the main UI
+        load_ui(self, configurationUi)  # Loading the main UI
         self.parent = parent
         self.thread_pool = QThreadPool()
         self.logger = logger
@@ -130,9 +129,10 @@ class Configuration(QDialog):
         """
         enable = self.enableHoverLine.isChecked()
         if enable:
+            colors = get_graph_colors(gui=self.parent)  # Same colors for every graph, so only read them once.
             for graph_dict in self.parent.graphs:
                 if len(graph_dict['plots']) > 0:
-                    create_infinite_line(gui=self.parent, graph_dict=graph_dict)
+                    create_infinite_line(gui=self.parent, graph_dict=graph_dict, colors=colors)
         else:
             for graph_dict in self.parent.graphs:
                 hover_line = graph_dict.get('line')
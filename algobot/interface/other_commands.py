@@ -10,13 +10,13 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List
 
 import pandas as pd
-from PyQt5 import QtGui, uic
+from PyQt5 import QtGui
 from PyQt5.QtCore import QDate, QThreadPool
 from PyQt5.QtWidgets import QApplication, QDialog, QLineEdit
 
 import algobot
 from algobot.helpers import ROOT_DIR, convert_long_interval, create_folder, get_logger, open_file_or_folder
-from algobot.interface.utils import confirm_message_box, create_popup, open_from_msg_box
+from algobot.interface.utils import confirm_message_box, create_popup, load_ui, open_from_msg_box
 from algobot.threads.download_thread import DownloadThread
 from algobot.threads.volatility_snooper_thread import VolatilitySnooperThread
 from algobot.threads.worker_thread import Worker
@@ -36,7 +36,7 @@ class OtherCommands(QDialog):
         Initializer for other commands QDialog. This is the main QDialog that supports CSV creation and data purges.
         """
         super(OtherCommands, self).__init__(parent)  # Initializing object
-        uic.loadUi(otherCommandsUi, self)  # Loading the main UI
+        load_ui(self, otherCommandsUi)  # Loading the main UI
         self.parent = parent
         self.thread_pool = QThreadPool()
         self.load_slots()
@@ -45,6 +45,9 @@ class OtherCommands(QDialog):
         self.set_date_thread = None
         self.current_date_list = None
 
+        if parent is not None and parent.ticker_completer is not None:
+            self.csvGenerationTicker.setCompleter(parent.ticker_completer)
+
     def mousePressEvent(self, _: QtGui.QMouseEvent) -> None:
         # pylint: disable=invalid-name
         """
@@ -5,10 +5,11 @@ File for the statistics window.
 import os
 from typing import Any, Dict
 
-from PyQt5 import QtCore, uic
+from PyQt5 import QtCore
 from PyQt5.QtWidgets import QDialog, QFormLayout, QLabel, QMainWindow, QTabWidget
 
 from algobot.helpers import ROOT_DIR, get_label_string
+from algobot.interface.utils import load_ui
 
 statisticsUi = os.path.join(ROOT_DIR, 'UI', 'statistics.ui')
 
@@ -19,7 +20,7 @@ class Statistics(QDialog):
     """
     def __init__(self, parent: QMainWindow = None):
         super(Statistics, self).__init__(parent)  # Initializing object
-        uic.loadUi(statisticsUi, self)  # Loading the main UI
+        load_ui(self, statisticsUi)  # Loading the main UI
         self.tabs = {}
 
     def remove_tab_if_needed(self, tab_type: str):
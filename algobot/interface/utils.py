@@ -2,15 +2,19 @@
 File containing utility functions for the GUI.
 """
 
-from datetime import datetime
-from typing import List, Union
+import importlib.util
+import os
+import time
+from typing import List, Optional, Union
 
 import talib
+from PyQt5 import uic
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
-from PyQt5.QtWidgets import (QComboBox, QDialog, QDoubleSpinBox, QLayout, QLineEdit, QMessageBox, QSizePolicy,
-                             QSpacerItem, QSpinBox, QTableWidget, QTableWidgetItem, QWidget)
+from PyQt5.QtWidgets import (QComboBox, QDialog, QDoubleSpinBox, QLabel, QLayout, QLineEdit, QMessageBox, QSizePolicy,
+                             QSpacerItem, QSpinBox, QTableView, QTableWidget, QTableWidgetItem, QWidget)
 
+from algobot.helpers import ROOT_DIR
 from algobot.interface.configuration_helpers import get_default_widget
 
 # TALIB sets moving averages by numbers. This is not very appealing in the frontend, so we'll map it to its
@@ -22,6 +26,11 @@ PRICE_TYPES = ['Open', 'High', 'Low', 'Close', 'Open/Close', 'High/Low']
 
 OPERATORS = ['>', '<', '>=', '<=', '==', '!=']
 
+MONITOR_REFRESH_INTERVAL_MS = 100  # Amount of milliseconds between activity monitor refreshes.
+STATS_REFRESH_INTERVAL_MS = 100  # Amount of milliseconds between bot statistics refreshes.
+
+UI_CACHE_DIR = os.path.join(ROOT_DIR, 'UI', '__pycache__')  # Compiled UI files get cached here.
+
 # Mappings from TALIB parameters to better display names.
 PARAMETER_MAP = {
     'acceleration': 'Acceleration',
@@ -64,6 +73,51 @@ PARAMETER_MAP = {
 }
 
 
+def get_compiled_ui_class(ui_file: str) -> Optional[type]:
+    """
+    Get the UI class generated from the UI file provided. The UI file is compiled to a Python module the first time (or
+    whenever the UI file changes) and cached, so subsequent startups don't have to parse its XML again.
+    :param ui_file: Path to the UI file.
+    :return: Generated UI class or None if the UI file could not be compiled or imported.
+    """
+    module_name = f'{os.path.splitext(os.path.basename(ui_file))[0]}_ui'
+    compiled_file = os.path.join(UI_CACHE_DIR, f'{module_name}.py')
+
+    try:
+        if not os.path.exists(compiled_file) or os.path.getmtime(compiled_file) < os.path.getmtime(ui_file):
+            os.makedirs(UI_CACHE_DIR, exist_ok=True)
+            temp_file = f'{compiled_file}.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                # Resources are compiled into algobot/assets.py, so that's where the UI should import them from.
+                uic.compileUi(ui_file, f, resource_suffix='.assets')
+            os.replace(temp_file, compiled_file)
+
+        spec = importlib.util.spec_from_file_location(module_name, compiled_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    return next((obj for name, obj in vars(module).items() if name.startswith('Ui_')), None)
+
+
+def load_ui(widget: QWidget, ui_file: str):
+    """
+    Loads the UI file provided into the widget provided. This uses a compiled version of the UI file when possible and
+    falls back to uic.loadUi() otherwise. Either way, child widgets end up as attributes of the widget.
+    :param widget: Widget to load UI into.
+    :param ui_file: Path to the UI file.
+    """
+    ui_class = get_compiled_ui_class(ui_file)
+    if ui_class is None:
+        uic.loadUi(ui_file, widget)
+        return
+
+    ui = ui_class()
+    ui.setupUi(widget)
+    vars(widget).update(vars(ui))
+
+
 def get_combobox_items(combobox: QComboBox) -> List[str]:
     """
     Get items inside a combobox.
@@ -209,6 +263,27 @@ def show_and_bring_window_to_front(window: QDialog):
     window.raise_()
 
 
+def get_current_time_string() -> str:
+    """
+    Returns the current local time in a YYYY-MM-DD HH:MM:SS format. This is built from time.localtime() directly, as
+    it's called for every table row and is cheaper than datetime.now().strftime().
+    :return: Current local time string.
+    """
+    now = time.localtime()
+    return f'{now.tm_year}-{now.tm_mon:02}-{now.tm_mday:02} {now.tm_hour:02}:{now.tm_min:02}:{now.tm_sec:02}'
+
+
+def set_text_if_changed(widget: Union[QLabel, QLineEdit], text: str):
+    """
+    Sets text to the widget provided only if it differs from its current text. This avoids scheduling a repaint when
+    nothing has changed.
+    :param widget: Widget to set text of.
+    :param text: Text to set.
+    """
+    if widget.text() != text:
+        widget.setText(text)
+
+
 def add_to_table(table: QTableWidget, data: list, insert_date: bool = True):
     """
     Function that will add specified data to a provided table.
@@ -220,14 +295,49 @@ def add_to_table(table: QTableWidget, data: list, insert_date: bool = True):
     columns = table.columnCount()
 
     if insert_date:
-        data.insert(0, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        data.insert(0, get_current_time_string())
 
     if len(data) != columns:
         raise ValueError('Data needs to have the same amount of columns as table.')
 
-    table.insertRow(row_position)
-    for column in range(0, columns):
-        value = data[column]
+    table.setUpdatesEnabled(False)
+    try:
+        table.insertRow(row_position)
+        set_table_row(table, row_position, data)
+    finally:
+        table.setUpdatesEnabled(True)
+
+
+def add_rows_to_table(table: QTableWidget, rows: List[list]):
+    """
+    Function that will add multiple rows of data to a provided table. The table is resized once and only repainted
+    after all rows have been added, instead of once per row.
+    :param table: Table we will add rows to.
+    :param rows: List of rows (with each row being a list of data) we will add to table.
+    """
+    columns = table.columnCount()
+    if any(len(row) != columns for row in rows):
+        raise ValueError('Data needs to have the same amount of columns as table.')
+
+    row_position = table.rowCount()
+    table.setUpdatesEnabled(False)
+    try:
+        table.setRowCount(row_position + len(rows))
+        for row in rows:
+            set_table_row(table, row_position, row)
+            row_position += 1
+    finally:
+        table.setUpdatesEnabled(True)
+
+
+def set_table_row(table: QTableWidget, row_position: int, data: list):
+    """
+    Sets items of the row provided in the table to the data provided.
+    :param table: Table we will set items in.
+    :param row_position: Row to set items of.
+    :param data: Data with one value for each column of the table.
+    """
+    for column, value in enumerate(data):
         if type(value) not in (int, float):
             item = QTableWidgetItem(str(value))
         else:
@@ -236,9 +346,12 @@ def add_to_table(table: QTableWidget, data: list, insert_date: bool = True):
         table.setItem(row_position, column, item)
 
 
-def clear_table(table: QTableWidget):
+def clear_table(table: Union[QTableWidget, QTableView]):
     """
-    Sets table row count to 0.
+    Sets table row count to 0. Tables backed by an activity monitor model get their model cleared instead.
     :param table: Table which is to be cleared.
     """
-    table.setRowCount(0)
+    if isinstance(table, QTableWidget):
+        table.setRowCount(0)
+    else:
+        table.model().clear()
@@ -5,12 +5,13 @@ Slots for Algobot GUI.
 from __future__ import annotations
 
 import webbrowser
+from functools import partial
 from typing import TYPE_CHECKING
 
 from algobot.enums import BACKTEST, LIVE, SIMULATION
 from algobot.helpers import open_folder
 from algobot.interface.utils import clear_table, show_and_bring_window_to_front
-from algobot.themes import set_bear_mode, set_bloomberg_mode, set_bull_mode, set_dark_mode, set_light_mode
+from algobot.themes import set_theme
 
 if TYPE_CHECKING:
     from algobot.__main__ import Interface
@@ -42,13 +43,13 @@ def create_configuration_slots(app, gui: Interface):
     """
     Creates configuration slots.
     """
-    gui.configuration.lightModeRadioButton.toggled.connect(lambda: set_light_mode(app, gui))
-    gui.configuration.darkModeRadioButton.toggled.connect(lambda: set_dark_mode(app, gui))
-    gui.configuration.bloombergModeRadioButton.toggled.connect(lambda: set_bloomberg_mode(app, gui))
-    gui.configuration.bullModeRadioButton.toggled.connect(lambda: set_bull_mode(app, gui))
-    gui.configuration.bearModeRadioButton.toggled.connect(lambda: set_bear_mode(app, gui))
-    gui.configuration.simpleLoggingRadioButton.clicked.connect(lambda: gui.set_advanced_logging(False))
-    gui.configuration.advancedLoggingRadioButton.clicked.connect(lambda: gui.set_advanced_logging(True))
+    gui.configuration.lightModeRadioButton.toggled.connect(partial(set_theme, app, gui, 'light'))
+    gui.configuration.darkModeRadioButton.toggled.connect(partial(set_theme, app, gui, 'dark'))
+    gui.configuration.bloombergModeRadioButton.toggled.connect(partial(set_theme, app, gui, 'bloomberg'))
+    gui.configuration.bullModeRadioButton.toggled.connect(partial(set_theme, app, gui, 'bull'))
+    gui.configuration.bearModeRadioButton.toggled.connect(partial(set_theme, app, gui, 'bear'))
+    gui.configuration.simpleLoggingRadioButton.clicked.connect(partial(gui.set_advanced_logging, False))
+    gui.configuration.advancedLoggingRadioButton.clicked.connect(partial(gui.set_advanced_logging, True))
 
     gui.configuration.updateBinanceValues.clicked.connect(gui.update_binance_values)
     gui.configuration.updateTickers.clicked.connect(gui.tickers_thread)
@@ -58,31 +59,32 @@ def create_action_slots(gui: Interface):
     """
     Creates actions slots.
     """
+    # These windows are only created when first accessed, so they're looked up when triggered instead of here.
     gui.otherCommandsAction.triggered.connect(lambda: show_and_bring_window_to_front(gui.other_commands))
-    gui.configurationAction.triggered.connect(lambda: show_and_bring_window_to_front(gui.configuration))
+    gui.configurationAction.triggered.connect(partial(show_and_bring_window_to_front, gui.configuration))
     gui.aboutAlgobotAction.triggered.connect(lambda: show_and_bring_window_to_front(gui.about))
     gui.strategyBuilderAction.triggered.connect(lambda: show_and_bring_window_to_front(gui.strategy_builder))
     gui.strategyManagerAction.triggered.connect(lambda: show_and_bring_window_to_front(gui.strategy_manager))
-    gui.liveStatisticsAction.triggered.connect(lambda: gui.show_statistics(0))
-    gui.simulationStatisticsAction.triggered.connect(lambda: gui.show_statistics(1))
-    gui.openBacktestResultsFolderAction.triggered.connect(lambda: open_folder("Backtest Results"))
-    gui.openOptimizerResultsFolderAction.triggered.connect(lambda: open_folder('Optimizer Results'))
-    gui.openVolatilityResultsFolderAction.triggered.connect(lambda: open_folder('Volatility Results'))
-    gui.openStrategiesFolderAction.triggered.connect(lambda: open_folder('Strategies'))
-    gui.openLogFolderAction.triggered.connect(lambda: open_folder("Logs"))
-    gui.openCsvFolderAction.triggered.connect(lambda: open_folder('CSV'))
-    gui.openDatabasesFolderAction.triggered.connect(lambda: open_folder('Databases'))
-    gui.openCredentialsFolderAction.triggered.connect(lambda: open_folder('Credentials'))
-    gui.openConfigurationsFolderAction.triggered.connect(lambda: open_folder('Configuration'))
+    gui.liveStatisticsAction.triggered.connect(partial(gui.show_statistics, 0))
+    gui.simulationStatisticsAction.triggered.connect(partial(gui.show_statistics, 1))
+    gui.openBacktestResultsFolderAction.triggered.connect(partial(open_folder, "Backtest Results"))
+    gui.openOptimizerResultsFolderAction.triggered.connect(partial(open_folder, 'Optimizer Results'))
+    gui.openVolatilityResultsFolderAction.triggered.connect(partial(open_folder, 'Volatility Results'))
+    gui.openStrategiesFolderAction.triggered.connect(partial(open_folder, 'Strategies'))
+    gui.openLogFolderAction.triggered.connect(partial(open_folder, "Logs"))
+    gui.openCsvFolderAction.triggered.connect(partial(open_folder, 'CSV'))
+    gui.openDatabasesFolderAction.triggered.connect(partial(open_folder, 'Databases'))
+    gui.openCredentialsFolderAction.triggered.connect(partial(open_folder, 'Credentials'))
+    gui.openConfigurationsFolderAction.triggered.connect(partial(open_folder, 'Configuration'))
     gui.sourceCodeAction.triggered.connect(lambda: webbrowser.open("https://github.com/ZENALC/algobot"))
-    gui.tradingViewLiveAction.triggered.connect(lambda: gui.open_trading_view(LIVE))
-    gui.tradingViewSimulationAction.triggered.connect(lambda: gui.open_trading_view(SIMULATION))
-    gui.tradingViewBacktestAction.triggered.connect(lambda: gui.open_trading_view(BACKTEST))
-    gui.tradingViewHomepageAction.triggered.connect(lambda: gui.open_trading_view(None))
-    gui.binanceHomepageAction.triggered.connect(lambda: gui.open_binance(None))
-    gui.binanceLiveAction.triggered.connect(lambda: gui.open_binance(LIVE))
-    gui.binanceSimulationAction.triggered.connect(lambda: gui.open_binance(SIMULATION))
-    gui.binanceBacktestAction.triggered.connect(lambda: gui.open_binance(BACKTEST))
+    gui.tradingViewLiveAction.triggered.connect(partial(gui.open_trading_view, LIVE))
+    gui.tradingViewSimulationAction.triggered.connect(partial(gui.open_trading_view, SIMULATION))
+    gui.tradingViewBacktestAction.triggered.connect(partial(gui.open_trading_view, BACKTEST))
+    gui.tradingViewHomepageAction.triggered.connect(partial(gui.open_trading_view, None))
+    gui.binanceHomepageAction.triggered.connect(partial(gui.open_binance, None))
+    gui.binanceLiveAction.triggered.connect(partial(gui.open_binance, LIVE))
+    gui.binanceSimulationAction.triggered.connect(partial(gui.open_binance, SIMULATION))
+    gui.binanceBacktestAction.triggered.connect(partial(gui.open_binance, BACKTEST))
     gui.wikiAction.triggered.connect(lambda: webbrowser.open("https://github.com/ZENALC/algobot/wiki"))
     gui.changesAction.triggered.connect(lambda: webbrowser.open("https://github.com/ZENALC/algobot/releases"))
 
@@ -92,20 +94,21 @@ def create_simulation_slots(gui: Interface):
     """
     Creates simulation slots.
     """
-    gui.runSimulationButton.clicked.connect(lambda: gui.initiate_bot_thread(caller=SIMULATION))
-    gui.endSimulationButton.clicked.connect(lambda: gui.end_bot_thread(caller=SIMULATION))
+    gui.runSimulationButton.clicked.connect(partial(gui.initiate_bot_thread, SIMULATION))
+    gui.endSimulationButton.clicked.connect(partial(gui.end_bot_thread, SIMULATION))
     gui.configureSimulationButton.clicked.connect(gui.show_simulation_settings)
-    gui.forceLongSimulationButton.clicked.connect(lambda: gui.force_long(SIMULATION))
-    gui.forceShortSimulationButton.clicked.connect(lambda: gui.force_short(SIMULATION))
-    gui.pauseBotSimulationButton.clicked.connect(lambda: gui.pause_or_resume_bot(SIMULATION))
-    gui.exitPositionSimulationButton.clicked.connect(lambda: gui.exit_position(SIMULATION, True))
-    gui.waitOverrideSimulationButton.clicked.connect(lambda: gui.exit_position(SIMULATION, False))
+    gui.forceLongSimulationButton.clicked.connect(partial(gui.force_long, SIMULATION))
+    gui.forceShortSimulationButton.clicked.connect(partial(gui.force_short, SIMULATION))
+    gui.pauseBotSimulationButton.clicked.connect(partial(gui.pause_or_resume_bot, SIMULATION))
+    gui.exitPositionSimulationButton.clicked.connect(partial(gui.exit_position, SIMULATION, True))
+    gui.waitOverrideSimulationButton.clicked.connect(partial(gui.exit_position, SIMULATION, False))
+    # Lambdas are kept here, as clicked() would otherwise pass its checked argument in as the foreign value.
     gui.enableSimulationCustomStopLossButton.clicked.connect(lambda: gui.set_custom_stop_loss(SIMULATION, True))
     gui.disableSimulationCustomStopLossButton.clicked.connect(lambda: gui.set_custom_stop_loss(SIMULATION, False))
-    gui.clearSimulationTableButton.clicked.connect(lambda: clear_table(gui.simulationActivityMonitor))
-    gui.clearSimulationTradesButton.clicked.connect(lambda: clear_table(gui.simulationHistoryTable))
-    gui.exportSimulationTradesButton.clicked.connect(lambda: gui.export_trades(caller=SIMULATION))
-    gui.importSimulationTradesButton.clicked.connect(lambda: gui.import_trades(caller=SIMULATION))
+    gui.clearSimulationTableButton.clicked.connect(partial(clear_table, gui.simulationActivityMonitor))
+    gui.clearSimulationTradesButton.clicked.connect(partial(clear_table, gui.simulationHistoryTable))
+    gui.exportSimulationTradesButton.clicked.connect(partial(gui.export_trades, SIMULATION))
+    gui.importSimulationTradesButton.clicked.connect(partial(gui.import_trades, SIMULATION))
 
 
 # noinspection DuplicatedCode
@@ -113,20 +116,21 @@ def create_bot_slots(gui: Interface):
     """
     Creates bot slots.
     """
-    gui.runBotButton.clicked.connect(lambda: gui.initiate_bot_thread(caller=LIVE))
-    gui.endBotButton.clicked.connect(lambda: gui.end_bot_thread(caller=LIVE))
+    gui.runBotButton.clicked.connect(partial(gui.initiate_bot_thread, LIVE))
+    gui.endBotButton.clicked.connect(partial(gui.end_bot_thread, LIVE))
     gui.configureBotButton.clicked.connect(gui.show_main_settings)
-    gui.forceLongButton.clicked.connect(lambda: gui.force_long(LIVE))
-    gui.forceShortButton.clicked.connect(lambda: gui.force_short(LIVE))
-    gui.pauseBotButton.clicked.connect(lambda: gui.pause_or_resume_bot(LIVE))
-    gui.exitPositionButton.clicked.connect(lambda: gui.exit_position(LIVE, True))
-    gui.waitOverrideButton.clicked.connect(lambda: gui.exit_position(LIVE, False))
+    gui.forceLongButton.clicked.connect(partial(gui.force_long, LIVE))
+    gui.forceShortButton.clicked.connect(partial(gui.force_short, LIVE))
+    gui.pauseBotButton.clicked.connect(partial(gui.pause_or_resume_bot, LIVE))
+    gui.exitPositionButton.clicked.connect(partial(gui.exit_position, LIVE, True))
+    gui.waitOverrideButton.clicked.connect(partial(gui.exit_position, LIVE, False))
+    # Lambdas are kept here, as clicked() would otherwise pass its checked argument in as the foreign value.
     gui.enableCustomStopLossButton.clicked.connect(lambda: gui.set_custom_stop_loss(LIVE, True))
     gui.disableCustomStopLossButton.clicked.connect(lambda: gui.set_custom_stop_loss(LIVE, False))
-    gui.clearTableButton.clicked.connect(lambda: clear_table(gui.activityMonitor))
-    gui.clearLiveTradesButton.clicked.connect(lambda: clear_table(gui.historyTable))
-    gui.exportLiveTradesButton.clicked.connect(lambda: gui.export_trades(caller=LIVE))
-    gui.importLiveTradesButton.clicked.connect(lambda: gui.import_trades(caller=LIVE))
+    gui.clearTableButton.clicked.connect(partial(clear_table, gui.activityMonitor))
+    gui.clearLiveTradesButton.clicked.connect(partial(clear_table, gui.historyTable))
+    gui.exportLiveTradesButton.clicked.connect(partial(gui.export_trades, LIVE))
+    gui.importLiveTradesButton.clicked.connect(partial(gui.import_trades, LIVE))
 
 
 def create_backtest_slots(gui: Interface):
@@ -136,8 +140,8 @@ def create_backtest_slots(gui: Interface):
     gui.configureBacktestButton.clicked.connect(gui.show_backtest_settings)
     gui.runBacktestButton.clicked.connect(gui.initiate_backtest)
     gui.endBacktestButton.clicked.connect(gui.end_backtest_thread)
-    gui.clearBacktestTableButton.clicked.connect(lambda: clear_table(gui.backtestTable))
-    gui.viewBacktestsButton.clicked.connect(lambda: open_folder("Backtest Results"))
+    gui.clearBacktestTableButton.clicked.connect(partial(clear_table, gui.backtestTable))
+    gui.viewBacktestsButton.clicked.connect(partial(open_folder, "Backtest Results"))
     gui.backtestResetCursorButton.clicked.connect(gui.reset_backtest_cursor)
 
 
@@ -148,5 +152,5 @@ def create_optimizer_slots(gui: Interface):
     gui.configureOptimizerButton.clicked.connect(gui.show_optimizer_settings)
     gui.runOptimizerButton.clicked.connect(gui.initiate_optimizer)
     gui.stopOptimizerButton.clicked.connect(gui.end_optimizer)
-    gui.exportOptimizerCSVButton.clicked.connect(lambda: gui.export_optimizer('CSV'))
-    gui.exportOptimizerXLSXButton.clicked.connect(lambda: gui.export_optimizer('XLSX'))
+    gui.exportOptimizerCSVButton.clicked.connect(partial(gui.export_optimizer, 'CSV'))
+    gui.exportOptimizerXLSXButton.clicked.connect(partial(gui.export_optimizer, 'XLSX'))
@@ -1,13 +1,13 @@
 """
 Custom strategy built from strategy builder.
 """
+import operator
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from algobot.traders.trader import Trader
 
 import numpy as np
-import pandas as pd
 from PyQt5.QtWidgets import QWidget
 from talib import abstract
 
@@ -16,6 +16,16 @@ from algobot.helpers import get_random_color
 from algobot.interface.configuration_helpers import get_input_widget_value
 from algobot.interface.utils import MOVING_AVERAGE_TYPES_BY_NAME, PRICE_TYPES
 
+# Comparison functions of operators strategy builder conditions can use (see OPERATORS in interface utils).
+OPERATOR_FUNCTIONS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
 
 class CustomStrategy:
     """
@@ -46,6 +56,13 @@ class CustomStrategy:
         # Store cache to avoid calculating again.
         self.cache = {}
 
+        # TALIB functions by indicator name. Functions are created once, as creating them is slower than calling them.
+        self.functions: Dict[str, abstract.Function] = {}
+
+        # TALIB kwargs, label, and cache key by operation ID. Operations don't change after parsing, so these are only
+        #  built once per operation instead of every period. The operation is kept alongside so its ID stays unique.
+        self.operation_info: Dict[int, Tuple[dict, dict, str, tuple]] = {}
+
         # Dictionary for plotting values in graphs. This should hold string keys and float values. If a value is
         #  non-numeric, the program will crash. This should hold the key of the value and then a list containing
         #  the value then the color.
@@ -94,9 +111,9 @@ class CustomStrategy:
     def get_indicator_val_and_label(
             self,
             operation: dict,
-            input_arrays_dict: Dict[str, pd.Series],
+            input_arrays_dict: Dict[str, np.ndarray],
             get_arr: bool = False
-    ) -> Tuple[Union[pd.Series, int, float], str]:
+    ) -> Tuple[Union[np.ndarray, int, float], str]:
         """
         Get indicator value and label. This also logs the value and label. TODO: Why log here? Separate it.
         :param operation: Dictionary containing indicator operation information in a dictionary.
@@ -104,14 +121,25 @@ class CustomStrategy:
         :param get_arr: Boolean whether to get entire array of results from TALIB or singular result value.
         :return:
         """
-        kwargs = self.get_func_kwargs(operation)
-        label = self.get_pretty_label(operation=operation, func_kwargs=kwargs)
+        operation_info = self.operation_info.get(id(operation))
+        if operation_info is None:
+            kwargs = self.get_func_kwargs(operation)
+            label = self.get_pretty_label(operation=operation, func_kwargs=kwargs)
+
+            # Labels don't contain every parameter, so values are cached by indicator, output, and parameters instead.
+            cache_key = (operation['indicator'], operation['output'], tuple(sorted(kwargs.items())))
+            operation_info = self.operation_info[id(operation)] = operation, kwargs, label, cache_key
+
+        _operation, kwargs, label, cache_key = operation_info
 
         # We have this value in our cache, so just quick-return.
-        if label in self.cache:
-            return self.cache[label], label
+        if cache_key in self.cache:
+            return self.cache[cache_key], label
+
+        func = self.functions.get(operation['indicator'])
+        if func is None:
+            func = self.functions[operation['indicator']] = abstract.Function(operation['indicator'])
 
-        func = abstract.Function(operation['indicator'])
         val = func(input_arrays_dict, **kwargs)
 
         output_index, _output_verbose = operation['output']
@@ -125,7 +153,7 @@ class CustomStrategy:
         if self.log_data and hasattr(self.trader, 'output_message'):
             self.trader.output_message(f'{label}: {val[-1]}')
 
-        self.cache[label] = val[-1]
+        self.cache[cache_key] = val[-1]
         return val[-1], label
 
     def populate_grouped_dict(self, grouped_dict: Dict[str, Dict[str, Any]]):
@@ -242,7 +270,7 @@ class CustomStrategy:
         """
         return 'lower' if self.in_lower_interval else 'regular'
 
-    def get_trend_by_key(self, key: str, input_arrays_dict: Dict[str, pd.Series]) -> bool:
+    def get_trend_by_key(self, key: str, input_arrays_dict: Dict[str, np.ndarray]) -> bool:
         """
         Get trend by key.
         :param key: Key to get trend of.
@@ -265,7 +293,7 @@ class CustomStrategy:
 
             if operation['against'] in PRICE_TYPES:
                 price_type = operation['against'].lower()
-                against_val = input_arrays_dict[price_type].iloc[-1]
+                against_val = input_arrays_dict[price_type][-1]
             elif isinstance(operation['against'], (float, int)):
                 against_val = operation['against']
             else:
@@ -276,7 +304,7 @@ class CustomStrategy:
                 if not self.in_lower_interval:
                     self.plot_dict[against_label][0] = against_val
 
-            result = eval(f'{val} {operation["operator"]} {against_val}')  # pylint: disable=eval-used
+            result = bool(OPERATOR_FUNCTIONS[operation['operator']](val, against_val))
             trends.append(result)
 
             if self.short_circuit and result is False:
@@ -287,7 +315,7 @@ class CustomStrategy:
         # Return true if all trends are true, else false.
         return trend_sentiment
 
-    def get_trend(self, input_arrays_dict: Dict[str, pd.Series], cache: Optional[Dict[str, Any]] = None,
+    def get_trend(self, input_arrays_dict: Dict[str, np.ndarray], cache: Optional[Dict[str, Any]] = None,
                   log_data: bool = False, in_lower_interval: bool = False):
         """
         There must be only one trend. If multiple trends are true, then return no trend.
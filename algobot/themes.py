@@ -11,53 +11,44 @@ from algobot.interface.palettes import bloomberg_palette, dark_palette, green_pa
 if TYPE_CHECKING:
     from algobot.__main__ import Interface
 
+# Palette function and graph background color of each theme. Bear and bull themes are red/green and black mimicking
+# red/green days.
+THEMES = {
+    'light': (light_palette, 'w'),
+    'dark': (dark_palette, 'k'),
+    'bloomberg': (bloomberg_palette, 'k'),
+    'bear': (red_palette, 'k'),
+    'bull': (green_palette, 'k'),
+}
+
 
 def bg_helper(color: str, gui: Interface):
     """
-    Helper function to set the background.
+    Helper function to set the background. Graphs are left alone if they already have the background provided.
     :param color: Color to set the background to.
     :param gui: GUI object to set background in.
     """
-    for graph in gui.graphs:
-        graph = graph['graph']
-        graph.setBackground(color)
-
-
-def set_dark_mode(app, gui: Interface):
-    """
-    Switches interface to a dark theme.
-    """
-    app.setPalette(dark_palette())
-    bg_helper('k', gui)
-
-
-def set_light_mode(app, gui: Interface):
-    """
-    Switches interface to a light theme.
-    """
-    app.setPalette(light_palette())
-    bg_helper('w', gui)
+    if gui.graph_background == color:
+        return
 
+    for graph in gui.graph_dicts:  # Keyed by graph widget, so no per-graph dictionary lookups are needed.
+        graph.setBackground(color)
 
-def set_bloomberg_mode(app, gui: Interface):
-    """
-    Switches interface to bloomberg theme.
-    """
-    app.setPalette(bloomberg_palette())
-    bg_helper('k', gui)
+    gui.graph_background = color
 
 
-def set_bear_mode(app, gui: Interface):
+def set_theme(app, gui: Interface, theme: str, enabled: bool = True):
     """
-    Sets bear mode color theme. Theme is red and black mimicking a red day.
+    Switches interface to the theme provided.
+    :param app: Application to set palette of.
+    :param gui: GUI object to set graph backgrounds in.
+    :param theme: Name of theme to switch to. Must be a key of THEMES.
+    :param enabled: Whether the theme was selected. When connected to a radio button's toggled signal, this avoids
+     applying the theme that was just deselected.
     """
-    app.setPalette(red_palette())
-    bg_helper('k', gui)
-
+    if not enabled:
+        return
 
-def set_bull_mode(app, gui: Interface):
-    """
-    Sets bull mode color theme. Theme is green and black mimicking a green day.
-    """
-    app.setPalette(green_palette())
-    bg_helper('k', gui)
+    palette, background = THEMES[theme]
+    app.setPalette(palette())
+    bg_helper(background, gui)
@@ -2,8 +2,11 @@
 Main bot thread (sim or live bot).
 """
 
+import operator
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
@@ -17,6 +20,65 @@ from algobot.telegram_bot.bot import TelegramBot
 from algobot.traders.real_trader import RealTrader
 from algobot.traders.simulation_trader import SimulationTrader
 
+MIN_LOOP_SECONDS = 1  # Minimum amount of seconds a trading loop takes, so bots don't poll for data nonstop.
+
+# Next lower interval of each interval bots can trade in, used for lower interval trading.
+LOWER_INTERVALS = {
+    '3m': '1m',
+    '5m': '3m',
+    '15m': '5m',
+    '30m': '15m',
+    '1h': '30m',
+    '2h': '1h',
+    '4h': '2h',
+    '6h': '4h',
+    '8h': '6h',
+    '12h': '8h',
+    '1d': '12h',
+    '3d': '1d',
+}
+
+
+@dataclass
+class TraderSettings:
+    """
+    Trader settings read from the GUI when a bot thread is created, so the bot thread doesn't have to query widgets.
+    Binance settings are only read for live bots and the starting balance only for simulations.
+    """
+    symbol: str
+    precision: str
+    pretty_interval: str
+    lower_interval_trading: bool
+    starting_balance: float = 0
+    api_key: str = ''
+    api_secret: str = ''
+    tld: str = 'us'
+    is_isolated: bool = False
+
+
+def get_trader_settings(gui, caller: str) -> TraderSettings:
+    """
+    Reads trader settings of the caller provided from the GUI. This should be called from the GUI thread.
+    :param gui: GUI object to read settings from.
+    :param caller: Caller that determines which settings are read.
+    :return: Trader settings.
+    """
+    config_dict = gui.interface_dictionary[caller]['configuration']
+    settings = TraderSettings(symbol=config_dict['ticker'].text(),
+                              precision=config_dict['precision'].currentText(),
+                              pretty_interval=config_dict['interval'].currentText(),
+                              lower_interval_trading=config_dict['lowerIntervalCheck'].isChecked())
+
+    if caller == SIMULATION:
+        settings.starting_balance = gui.configuration.simulationStartingBalanceSpinBox.value()
+    elif caller == LIVE:
+        settings.api_key = gui.configuration.binanceApiKey.text()
+        settings.api_secret = gui.configuration.binanceApiSecret.text()
+        settings.tld = 'com' if gui.configuration.otherRegionRadio.isChecked() else 'us'
+        settings.is_isolated = gui.configuration.isolatedMarginAccountRadio.isChecked()
+
+    return settings
+
 
 class BotSignals(QObject):
     """
@@ -25,7 +87,6 @@ class BotSignals(QObject):
     small_error = pyqtSignal(str)  # Signal emitted when small errors such as internet losses occur.
     started = pyqtSignal(str)  # Signal emitted when bot first starts.
     activity = pyqtSignal(str, str)  # Signal emitted to broadcast current activity.
-    updated = pyqtSignal(str, dict, dict)  # Signal emitted when bot is updated.
     finished = pyqtSignal()  # Signal emitted when bot is ended.
     error = pyqtSignal(str, str)  # Signal emitted when a critical error occurs.
     restore = pyqtSignal()  # Signal emitted to restore GUI.
@@ -71,6 +132,7 @@ class BotThread(QRunnable):
         self.telegram_chat_id = gui.configuration.telegramChatID.text()
         self.caller = caller
         self.trader = None
+        self.trader_settings = get_trader_settings(gui, caller)
 
         self.failed = False  # All these variables pertain to bot failures.
         self.fail_count = 0  # Current amount of times the bot has failed.
@@ -84,12 +146,11 @@ class BotThread(QRunnable):
         :param caller: Caller that determines whether lower interval is for simulation or live bot.
         :param interval: Current interval for simulation or live bot.
         """
-        sorted_intervals = ('1m', '3m', '5m', '15m', '30m', '1h', '2h', '12h', '4h', '6h', '8h', '1d', '3d')
         gui = self.gui
         symbol = self.trader.symbol
 
         if interval != '1m':
-            lower_interval = sorted_intervals[sorted_intervals.index(interval) - 1]
+            lower_interval = LOWER_INTERVALS[interval]
             interval_string = convert_small_interval(lower_interval)
             self.lower_interval_notification = True
             self.signals.activity.emit(caller, f'Retrieving {symbol} data for {interval_string.lower()} intervals...')
@@ -119,16 +180,15 @@ class BotThread(QRunnable):
         :param caller: Caller that determines what type of trader will be created.
         """
         gui = self.gui
-        config_dict = gui.interface_dictionary[caller]['configuration']
-        symbol = config_dict['ticker'].text()
-        precision = parse_precision(config_dict['precision'].currentText(), symbol)
-        pretty_interval = config_dict['interval'].currentText()
+        settings = self.trader_settings
+        symbol = settings.symbol
+        precision = parse_precision(settings.precision, symbol)
+        pretty_interval = settings.pretty_interval
         interval = convert_long_interval(pretty_interval)
 
         if caller == SIMULATION:
-            starting_balance = gui.configuration.simulationStartingBalanceSpinBox.value()
             self.signals.activity.emit(caller, f"Retrieving {symbol} data for {pretty_interval.lower()} intervals...")
-            gui.simulation_trader = SimulationTrader(starting_balance=starting_balance,
+            gui.simulation_trader = SimulationTrader(starting_balance=settings.starting_balance,
                                                      symbol=symbol,
                                                      interval=interval,
                                                      load_data=True,
@@ -137,18 +197,14 @@ class BotThread(QRunnable):
             gui.simulation_trader.data_view.custom_get_new_data(progress_callback=self.signals.progress,
                                                                 remove_first=True, caller=SIMULATION)
         elif caller == LIVE:
-            api_secret = gui.configuration.binanceApiSecret.text()
-            api_key = gui.configuration.binanceApiKey.text()
-            tld = 'com' if gui.configuration.otherRegionRadio.isChecked() else 'us'
-            is_isolated = gui.configuration.isolatedMarginAccountRadio.isChecked()
-            self.check_api_credentials(api_key=api_key, api_secret=api_secret)
+            self.check_api_credentials(api_key=settings.api_key, api_secret=settings.api_secret)
             self.signals.activity.emit(caller, f"Retrieving {symbol} data for {pretty_interval.lower()} intervals...")
-            gui.trader = RealTrader(api_secret=api_secret,
-                                    api_key=api_key,
+            gui.trader = RealTrader(api_secret=settings.api_secret,
+                                    api_key=settings.api_key,
                                     interval=interval,
                                     symbol=symbol,
-                                    tld=tld,
-                                    is_isolated=is_isolated,
+                                    tld=settings.tld,
+                                    is_isolated=settings.is_isolated,
                                     load_data=True,
                                     update_data=False,
                                     precision=precision)
@@ -166,7 +222,7 @@ class BotThread(QRunnable):
 
         self.signals.activity.emit(caller, "Retrieved data successfully.")
 
-        if config_dict['lowerIntervalCheck'].isChecked():
+        if settings.lower_interval_trading:
             self.initialize_lower_interval_trading(caller=caller, interval=interval)
 
     @staticmethod
@@ -237,11 +293,16 @@ class BotThread(QRunnable):
         Initial full bot setup based on caller.
         :param caller: Caller that will determine what type of trader will be instantiated.
         """
-        self.create_trader(caller)
-        self.set_parameters(caller)
+        initialize_telegram = self.gui.configuration.enableTelegramTrading.isChecked()
 
-        if self.gui.configuration.enableTelegramTrading.isChecked() and self.gui.telegram_bot is None:
-            self.initialize_telegram_bot()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The Telegram bot is started while trader data is downloading, as both mostly wait on the network.
+            telegram_future = executor.submit(self.initialize_telegram_bot) if initialize_telegram else None
+            self.create_trader(caller)
+            self.set_parameters(caller)
+
+            if telegram_future is not None:
+                telegram_future.result()  # Telegram errors are raised here, so they fail the bot setup like before.
 
         if self.gui.configuration.schedulingStatisticsCheckBox.isChecked():
             self.initialize_scheduler()
@@ -290,16 +351,23 @@ class BotThread(QRunnable):
 
     def initialize_telegram_bot(self):
         """
-        Attempts to initiate Telegram bot.
+        Attempts to initiate Telegram bot. Nothing is done if the Telegram bot was already started, which is checked
+         under the GUI's Telegram lock so two bots starting at the same time don't both start one.
         """
         gui = self.gui
-        test_telegram(config_obj=gui.configuration)
-        api_key = gui.configuration.telegramApiKey.text()
-        gui.telegram_bot = TelegramBot(gui=gui, token=api_key)
-        gui.telegram_bot.start()
+        with gui.telegram_bot_lock:
+            if gui.telegram_bot is not None:
+                return
+
+            test_telegram(config_obj=gui.configuration)
+            api_key = gui.configuration.telegramApiKey.text()
+            telegram_bot = TelegramBot(gui=gui, token=api_key)
+            telegram_bot.start()
+            gui.telegram_bot = telegram_bot
+
         self.signals.activity.emit(LIVE, 'Started Telegram bot.')
-        if self.gui.telegram_bot and gui.configuration.chat_pass:
-            self.gui.telegram_bot.send_message(self.telegram_chat_id, "Started Telegram bot.")
+        if gui.configuration.chat_pass:
+            gui.telegram_bot.send_message(self.telegram_chat_id, "Started Telegram bot.")
 
     def handle_lower_interval_cross(self, caller, previous_lower_trend) -> bool or None:
         """
@@ -356,19 +424,25 @@ class BotThread(QRunnable):
         self.elapsed = get_elapsed_time(self.starting_time)
         self.set_daily_percentages(trader=trader, net=net)
 
+        # These strings are shared by both dictionaries, so they only get formatted once.
+        rounded_profit = round(profit, 2)
+        net_string = f'${round(net, 2)}'
+        percentage_string = f'{round(self.percentage, 2)}%'
+
         grouped_dict = trader.get_grouped_statistics()
-        grouped_dict['general']['net'] = f'${round(net, 2)}'
-        grouped_dict['general']['profit'] = f'${round(profit, 2)}'
-        grouped_dict['general']['elapsed'] = self.elapsed
-        grouped_dict['general']['totalPercentage'] = f'{round(self.percentage, 2)}%'
-        grouped_dict['general']['dailyPercentage'] = f'{round(self.daily_percentage, 2)}%'
-        grouped_dict['general']['lowerTrend'] = self.lower_trend
+        general_dict = grouped_dict['general']
+        general_dict['net'] = net_string
+        general_dict['profit'] = f'${rounded_profit}'
+        general_dict['elapsed'] = self.elapsed
+        general_dict['totalPercentage'] = percentage_string
+        general_dict['dailyPercentage'] = f'{round(self.daily_percentage, 2)}%'
+        general_dict['lowerTrend'] = self.lower_trend
 
         value_dict = {
             'profitLossLabel': trader.get_profit_or_loss_string(profit=profit),
-            'profitLossValue': f'${abs(round(profit, 2))}',
-            'percentageValue': f'{round(self.percentage, 2)}%',
-            'netValue': f'${round(net, 2)}',
+            'profitLossValue': f'${abs(rounded_profit)}',
+            'percentageValue': percentage_string,
+            'netValue': net_string,
             'tickerValue': f'${trader.current_price}',
             'tickerLabel': trader.symbol,
             'currentPositionValue': trader.get_position_string(),
@@ -384,10 +458,13 @@ class BotThread(QRunnable):
         :param caller: Caller object that determines which bot is running.
         """
         lower_trend = None  # This variable is used for lower trend notification logic.
-        running_loop = self.gui.running_live if caller == LIVE else self.gui.simulation_running_live
-        trader: SimulationTrader = self.gui.get_trader(caller=caller)
+        gui = self.gui
+        get_running_loop = operator.attrgetter('running_live' if caller == LIVE else 'simulation_running_live')
+        running_loop = get_running_loop(gui)
+        trader: SimulationTrader = gui.get_trader(caller=caller)
 
         while running_loop:
+            loop_start_time = time.time()
             trader.completed_loop = False  # This boolean is checked when bot is ended to ensure it finishes its loop.
             self.update_data(caller)  # Check for new updates.
             self.handle_logging(caller=caller)  # Handle logging.
@@ -395,9 +472,13 @@ class BotThread(QRunnable):
             self.handle_trading(caller=caller)  # Main logic function.
             self.handle_scheduler()  # Handle periodic statistics scheduler.
             lower_trend = self.handle_lower_interval_cross(caller, lower_trend)  # Check lower trend.
-            value_dict, grouped_dict = self.get_statistics()  # Basic statistics of bot to update GUI.
-            self.signals.updated.emit(caller, value_dict, grouped_dict)
-            running_loop = self.gui.running_live if caller == LIVE else self.gui.simulation_running_live
+            # Wait out the rest of the loop before checking if the bot was ended, so ending it doesn't start another.
+            time.sleep(max(0, MIN_LOOP_SECONDS - (time.time() - loop_start_time)))
+            running_loop = get_running_loop(gui)
+            # Basic statistics of bot to update GUI. They're only rebuilt once the GUI has shown the previous ones or
+            #  when this is the last loop, so the GUI always ends up with the final statistics.
+            if not running_loop or not gui.has_pending_stats(caller):
+                gui.set_latest_stats(caller, self.get_statistics())
             self.fail_count = 0  # Reset fail count as bot fixed itself.
             trader.completed_loop = True  # Set completed_loop to True. Or, there'll be an infinite loop in the GUI.
 
@@ -3,7 +3,6 @@ Some helpers for threads.
 """
 from typing import Any, Dict
 
-from algobot.algodict import get_interface_dictionary
 from algobot.enums import BACKTEST, OPTIMIZER
 from algobot.helpers import parse_precision
 from algobot.interface.config_utils.calendar_utils import get_calendar_dates
@@ -17,7 +16,7 @@ def get_config_helper(gui, caller) -> Dict[str, Any]:
     :param caller: Caller object (backtest or optimizer in this case).
     :return: Dictionary containing configuration settings.
     """
-    algo_dict = get_interface_dictionary(gui, caller)['configuration']
+    algo_dict = gui.interface_dictionary[caller]['configuration']
     start_date, end_date = get_calendar_dates(config_obj=gui.configuration, caller=caller)
     precision = algo_dict['precision'].currentText()
     symbol = gui.configuration.optimizer_backtest_dict[caller]['dataType']
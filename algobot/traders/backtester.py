@@ -2,15 +2,18 @@
 Backtester object.
 """
 
+import io
 import os
 import sys
 import time
 import traceback
+from collections import deque
 from datetime import datetime, timedelta
 from itertools import product
 from logging import Logger
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from dateutil import parser
 
@@ -21,6 +24,10 @@ from algobot.helpers import (LOG_FOLDER, ROOT_DIR, convert_all_dates_to_datetime
 from algobot.traders.trader import Trader
 from algobot.typing_hints import DataType, DictType
 
+STRATEGY_DATA_PERIODS = 250  # Amount of latest periods strategies get to calculate their trends with.
+PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')  # Price types of data periods strategies use.
+STRATEGY_PRICE_TYPES = PRICE_COLUMNS + ('high/low', 'open/close')  # Price types strategies get, including averages.
+
 
 class Backtester(Trader):
     """
@@ -53,6 +60,9 @@ class Backtester(Trader):
         self.data = data
         self.check_data()
 
+        # First and last timestamps of the data. These are cached here, so the GUI doesn't have to recompute them.
+        self.data_timestamp_range = (self.data[0]['date_utc'].timestamp(), self.data[-1]['date_utc'].timestamp())
+
         self.interval = self.get_interval()
         self.interval_minutes = get_interval_minutes(self.interval)
 
@@ -68,6 +78,12 @@ class Backtester(Trader):
         self.optimizer_rows = []
         self.logger = logger
 
+        # Indicator values by strategy interval and period index. This is only kept while optimizing, so runs with the
+        #  same strategy interval don't recompute indicator values a previous run already computed.
+        self.indicator_cache: Optional[Dict[Tuple[str, int], dict]] = None
+        # Price arrays of all data. Data doesn't change between optimizer runs, so these are built once per optimizer.
+        self.data_arrays_dict: Optional[Dict[str, np.ndarray]] = None
+
         if len(strategy_interval.split()) == 1:
             strategy_interval = convert_small_interval(strategy_interval)
 
@@ -129,7 +145,7 @@ class Backtester(Trader):
     def check_data(self):
         """
         Checks data sorting. If descending, it reverses data, so we can mimic backtest as if we are starting from the
-        beginning.
+        beginning. A reversed copy is made, so the order of the caller's data list is left alone.
         """
         first_date = self.data[0]['date_utc']
         last_date = self.data[-1]['date_utc']
@@ -147,13 +163,10 @@ class Backtester(Trader):
         if isinstance(target_date, datetime):
             target_date = target_date.date()
 
-        iterator = list(enumerate(self.data))
-
-        if not starting:
-            iterator = reversed(list(enumerate(self.data)))
-
-        for index, data in iterator:
-            if data['date_utc'].date() == target_date:
+        data = self.data
+        indices = range(len(data)) if starting else range(len(data) - 1, -1, -1)
+        for index in indices:
+            if data[index]['date_utc'].date() == target_date:
                 return index
 
         raise IndexError("Date not found.")
@@ -205,20 +218,67 @@ class Backtester(Trader):
                f'{strategy.name}. You can find more details about the crash in the ' \
                f'logs file at {os.path.join(ROOT_DIR, LOG_FOLDER)}.'
 
-    def strategy_loop(self, strategy_data, thread) -> Optional[str]:
+    @staticmethod
+    def get_input_arrays_dict(data: DataType) -> Dict[str, np.ndarray]:
+        """
+        Returns price arrays of data provided to feed into strategies.
+        :param data: Data to get price arrays of.
+        :return: Dictionary containing price type as key and price values as value.
+        """
+        input_arrays_dict = {key: np.array([period[key] for period in data], dtype=float) for key in PRICE_COLUMNS}
+        input_arrays_dict['high/low'] = (input_arrays_dict['high'] + input_arrays_dict['low']) / 2
+        input_arrays_dict['open/close'] = (input_arrays_dict['open'] + input_arrays_dict['close']) / 2
+        return input_arrays_dict
+
+    @staticmethod
+    def get_price_values(period: DictType) -> Dict[str, float]:
+        """
+        Returns values of all price types strategies get of the period provided.
+        :param period: Period to get price values of.
+        :return: Dictionary containing price type as key and price value as value.
+        """
+        price_values = {key: period[key] for key in PRICE_COLUMNS}
+        price_values['high/low'] = (period['high'] + period['low']) / 2
+        price_values['open/close'] = (period['open'] + period['close']) / 2
+        return price_values
+
+    @staticmethod
+    def get_gap_input_arrays_dict(gap_columns: Dict[str, Deque[float]],
+                                  current_values: Dict[str, float]) -> Dict[str, np.ndarray]:
+        """
+        Returns price arrays of gap data provided followed by the current period to feed into strategies.
+        :param gap_columns: Dictionary containing price type as key and gap data values of that price type as value.
+        :param current_values: Price values of the current period to add to the end of the price arrays.
+        :return: Dictionary containing price type as key and price values as value.
+        """
+        input_arrays_dict = {}
+        for key, column in gap_columns.items():
+            values = np.empty(len(column) + 1)
+            values[:-1] = column
+            values[-1] = current_values[key]
+            input_arrays_dict[key] = values
+        return input_arrays_dict
+
+    def get_period_cache(self, index: int) -> dict:
+        """
+        Returns cache strategies should store their indicator values of the period at the index provided in.
+        :param index: Index of period in data.
+        :return: Cache dictionary. Shared with previous runs with the same strategy interval if optimizing.
+        """
+        if self.indicator_cache is None:
+            return {}
+        return self.indicator_cache.setdefault((self.strategy_interval, index), {})
+
+    def strategy_loop(self, input_arrays_dict: Dict[str, np.ndarray], thread, cache: dict = None) -> Optional[str]:
         """
         This will traverse through all strategies and attempt to get their trends.
-        :param strategy_data: Data to use to get the strategy trend.
+        :param input_arrays_dict: Dictionary containing price type as key and price values as value to use to get the
+         strategy trend.
         :param thread: Thread object (if exists).
+        :param cache: Cache for strategies to store indicator values in.
         :return: String "CRASHED" if an error is raised, else None if everything goes smoothly.
         """
-        cache = {}
-        df = pd.DataFrame(strategy_data[-250:])
-        df['high/low'] = (df['high'] + df['low']) / 2
-        df['open/close'] = (df['open'] + df['close']) / 2
-        df.columns = [c.lower() for c in df.columns]
-        input_arrays_dict = df.to_dict('series')
-
+        cache = {} if cache is None else cache
         for strategy in self.strategies.values():
             try:
                 strategy.get_trend(input_arrays_dict, cache)
@@ -303,10 +363,20 @@ class Backtester(Trader):
         :param test_length: Length of backtest.
         :param thread: Optional thread that called this function that'll be used for emitting signals.
         """
-        seen_data = self.data[:self.start_date_index]
-        strategy_data = seen_data if self.strategy_interval_minutes == self.interval_minutes else []
+        same_interval = self.strategy_interval_minutes == self.interval_minutes
         next_insertion = self.data[self.start_date_index]['date_utc'] + timedelta(
             minutes=self.strategy_interval_minutes)
+        # Strategy data is the same as seen data when there's no strategy interval gap, so its price arrays can be built
+        #  once for all data and then be sliced for each period instead of being rebuilt every period.
+        data_arrays_dict = None
+        if same_interval:
+            data_arrays_dict = self.data_arrays_dict or self.get_input_arrays_dict(self.data)
+        # Otherwise, strategies get the latest gap data followed by the current period. Only as much gap data as
+        #  strategies get is kept, in a bounded buffer for each price type. Price averages are buffered as well, so
+        #  only the current period's averages have to be calculated every period.
+        gap_columns = {key: deque(maxlen=STRATEGY_DATA_PERIODS - 1) for key in STRATEGY_PRICE_TYPES}
+        gap_periods = 0  # Amount of gap data periods so far, including the ones no longer in the buffers.
+        drawdown_net = (1 - self.drawdown_percentage_decimal) * self.starting_balance
         index = None
         for index in range(self.start_date_index, self.end_date_index + 1):
             if thread and not thread.running:
@@ -316,34 +386,38 @@ class Backtester(Trader):
                     raise RuntimeError("Optimizer was canceled.")
 
             self.set_indexed_current_price_and_period(index)
-            seen_data.append(self.current_period)
 
             self.main_logic()
-            if self.get_net() < 10:
+            net = self.get_net()
+            if net < 10:
                 if thread and thread.caller == BACKTEST:
                     thread.signals.message.emit("Backtester ran out of money. Change your strategy or date interval.")
                 self.exit_backtest(index)
                 return 'OUT OF MONEY'
-            elif self.get_net() < (1 - self.drawdown_percentage_decimal) * self.starting_balance:
+            elif net < drawdown_net:
                 return 'DRAWDOWN'
 
             result = None  # Result of strategy loop to ensure nothing crashed -> None is good, anything else is bad.
-            if strategy_data is seen_data:
-                if len(strategy_data) >= self.min_period:
-                    result = self.strategy_loop(strategy_data=strategy_data, thread=thread)
+            if same_interval:
+                if index + 1 >= self.min_period:
+                    start = max(index + 1 - STRATEGY_DATA_PERIODS, 0)
+                    input_arrays_dict = {key: values[start: index + 1] for key, values in data_arrays_dict.items()}
+                    result = self.strategy_loop(input_arrays_dict, thread, cache=self.get_period_cache(index))
             else:
-                if len(strategy_data) + 1 >= self.min_period:
-                    strategy_data.append(self.current_period)
-                    result = self.strategy_loop(strategy_data=strategy_data, thread=thread)
-                    strategy_data.pop()
+                if gap_periods + 1 >= self.min_period:
+                    current_values = self.get_price_values(self.current_period)
+                    input_arrays_dict = self.get_gap_input_arrays_dict(gap_columns, current_values)
+                    result = self.strategy_loop(input_arrays_dict, thread, cache=self.get_period_cache(index))
 
             if result is not None:
                 return result
 
-            if seen_data is not strategy_data and self.current_period['date_utc'] >= next_insertion:
+            if not same_interval and self.current_period['date_utc'] >= next_insertion:
                 next_insertion = self.current_period['date_utc'] + timedelta(minutes=self.strategy_interval_minutes)
-                gap_data = self.get_gap_data(seen_data[-self.interval_gap_multiplier - 1: -1])
-                strategy_data.append(gap_data)
+                gap_data = self.get_gap_data(self.data[max(index - self.interval_gap_multiplier, 0): index])
+                for key, value in self.get_price_values(gap_data).items():
+                    gap_columns[key].append(value)
+                gap_periods += 1
 
             if thread and thread.caller == BACKTEST and index % divisor == 0:
                 thread.signals.activity.emit(thread.get_activity_dictionary(self.current_period, index, test_length))
@@ -462,19 +536,24 @@ class Backtester(Trader):
         if thread:
             thread.signals.started.emit()
 
-        for index, settings in enumerate(settings_list, start=1):
-            if thread and not thread.running:
-                break
-            if was_thread and not thread:
-                break  # Bug fix for optimizer keeping on running even after it was stopped.
+        self.indicator_cache = {}
+        self.data_arrays_dict = self.get_input_arrays_dict(self.data)
+        try:
+            for index, settings in enumerate(settings_list, start=1):
+                if thread and not thread.running:
+                    break
+                if was_thread and not thread:
+                    break  # Bug fix for optimizer keeping on running even after it was stopped.
 
-            self.apply_general_settings(settings)
-            result = self.start_backtest(thread)
+                self.apply_general_settings(settings)
+                result = self.start_backtest(thread)
 
-            if thread:
-                thread.signals.activity.emit(self.get_basic_optimize_info(index, len(settings_list), result=result))
+                if thread:
+                    thread.signals.activity.emit(self.get_basic_optimize_info(index, len(settings_list), result=result))
 
-            self.restore()
+                self.restore()
+        finally:
+            self.indicator_cache = self.data_arrays_dict = None
 
     def get_basic_optimize_info(self, run: int, total_runs: int, result: str = 'PASSED') -> tuple:
         """
@@ -635,62 +714,53 @@ class Backtester(Trader):
     def print_configuration_parameters(self, stdout=None):
         """
         Prints out configuration parameters.
+        :param stdout: Stream to print to. No stream means sys.stdout.
         """
-        previous_stdout = sys.stdout
-        if stdout is not None:  # Temporarily redirects output to stdout provided.
-            sys.stdout = stdout
-
-        print("Backtest configuration:")
-        print(f'\tInterval: {self.interval}')
-        print(f'\tDrawdown Percentage: {self.drawdown_percentage_decimal * 100}')
-        print(f'\tMargin Enabled: {self.margin_enabled}')
-        print(f"\tStarting Balance: ${self.starting_balance}")
+        print("Backtest configuration:", file=stdout)
+        print(f'\tInterval: {self.interval}', file=stdout)
+        print(f'\tDrawdown Percentage: {self.drawdown_percentage_decimal * 100}', file=stdout)
+        print(f'\tMargin Enabled: {self.margin_enabled}', file=stdout)
+        print(f"\tStarting Balance: ${self.starting_balance}", file=stdout)
 
         if self.take_profit_type is not None:
-            print(f'\tTake Profit Percentage: {round(self.take_profit_percentage_decimal * 100, 2)}%')
+            print(f'\tTake Profit Percentage: {round(self.take_profit_percentage_decimal * 100, 2)}%', file=stdout)
 
         if self.loss_strategy is not None:
-            print(f'\tStop Loss Strategy: {self.get_stop_loss_strategy_string()}')
-            print(f'\tStop Loss Percentage: {round(self.loss_percentage_decimal * 100, 2)}%')
-            print(f"\tSmart Stop Loss Counter: {self.smart_stop_loss_initial_counter}")
+            print(f'\tStop Loss Strategy: {self.get_stop_loss_strategy_string()}', file=stdout)
+            print(f'\tStop Loss Percentage: {round(self.loss_percentage_decimal * 100, 2)}%', file=stdout)
+            print(f"\tSmart Stop Loss Counter: {self.smart_stop_loss_initial_counter}", file=stdout)
 
-        print(self.get_strategies_info_string())
-        sys.stdout = previous_stdout  # revert stdout back to normal
+        print(self.get_strategies_info_string(), file=stdout)
 
     def print_backtest_results(self, stdout=None):
         """
         Prints out backtest results.
-        """
-        previous_stdout = sys.stdout
-        if stdout is not None:  # Temporarily redirects output to stdout provided.
-            sys.stdout = stdout
-
-        print("\nBacktest results:")
-        print(f'\tSymbol: {"Unknown/Imported Data" if self.symbol is None else self.symbol}')
-        print(f'\tElapsed: {round(self.ending_time - self.starting_time, 2)} seconds')
-        print(f'\tStart Period: {self.data[self.start_date_index]["date_utc"]}')
-        print(f"\tEnd Period: {self.current_period['date_utc']}")
-        print(f'\tStarting balance: ${round(self.starting_balance, self.precision)}')
-        print(f'\tNet: ${round(self.get_net(), self.precision)}')
-        print(f'\tCommissions paid: ${round(self.commissions_paid, self.precision)}')
-        print(f'\tTrades made: {len(self.trades)}')
+        :param stdout: Stream to print to. No stream means sys.stdout.
+        """
+        print("\nBacktest results:", file=stdout)
+        print(f'\tSymbol: {"Unknown/Imported Data" if self.symbol is None else self.symbol}', file=stdout)
+        print(f'\tElapsed: {round(self.ending_time - self.starting_time, 2)} seconds', file=stdout)
+        print(f'\tStart Period: {self.data[self.start_date_index]["date_utc"]}', file=stdout)
+        print(f"\tEnd Period: {self.current_period['date_utc']}", file=stdout)
+        print(f'\tStarting balance: ${round(self.starting_balance, self.precision)}', file=stdout)
+        print(f'\tNet: ${round(self.get_net(), self.precision)}', file=stdout)
+        print(f'\tCommissions paid: ${round(self.commissions_paid, self.precision)}', file=stdout)
+        print(f'\tTrades made: {len(self.trades)}', file=stdout)
         net = self.get_net()
         difference = round(net - self.starting_balance, self.precision)
         if difference > 0:
-            print(f'\tProfit: ${difference}')
-            print(f'\tProfit Percentage: {round(net / self.starting_balance * 100 - 100, 2)}%')
+            print(f'\tProfit: ${difference}', file=stdout)
+            print(f'\tProfit Percentage: {round(net / self.starting_balance * 100 - 100, 2)}%', file=stdout)
         elif difference < 0:
-            print(f'\tLoss: ${-difference}')
-            print(f'\tLoss Percentage: {round(100 - net / self.starting_balance * 100, 2)}%')
+            print(f'\tLoss: ${-difference}', file=stdout)
+            print(f'\tLoss Percentage: {round(100 - net / self.starting_balance * 100, 2)}%', file=stdout)
         else:
-            print("\tNo profit or loss incurred.")
+            print("\tNo profit or loss incurred.", file=stdout)
         # print(f'Balance: ${round(self.balance, 2)}')
         # print(f'Coin owed: {round(self.coin_owed, 2)}')
         # print(f'Coin owned: {round(self.coin, 2)}')
         # print(f'Trend: {self.trend}')
 
-        sys.stdout = previous_stdout  # revert stdout back to normal
-
     def print_stats(self):
         """
         Prints basic statistics.
@@ -702,15 +772,9 @@ class Backtester(Trader):
         """
         Prints out all the trades conducted so far.
         """
-        previous_stdout = sys.stdout
-        if stdout is not None:  # Temporarily redirects output to stdout provided.
-            sys.stdout = stdout
-
-        print("\nTrades made:")
-        for trade in self.trades:
-            print(f'\t{trade["date"].strftime("%Y-%m-%d %H:%M")}: (${trade["net"]}) {trade["action"]}')
-
-        sys.stdout = previous_stdout  # revert stdout back to normal
+        lines = [f'\t{trade["date"].strftime("%Y-%m-%d %H:%M")}: (${trade["net"]}) {trade["action"]}'
+                 for trade in self.trades]
+        print('\n'.join(["\nTrades made:", *lines]), file=stdout)  # Printed in one call. No stdout means sys.stdout.
 
     def get_default_result_file_name(self, name: str = 'backtest', ext: str = 'txt'):
         """
@@ -729,10 +793,11 @@ class Backtester(Trader):
         if not os.path.exists(inner_folder):
             return result_file
 
+        existing_files = set(os.listdir(inner_folder))  # Listed once instead of checking each candidate name.
         counter = 0
         previous_file = result_file
 
-        while os.path.exists(os.path.join(inner_folder, result_file)):
+        while result_file in existing_files:
             result_file = f'({counter}){previous_file}'  # (1), (2)
             counter += 1
 
@@ -747,11 +812,15 @@ class Backtester(Trader):
         if not result_file:
             result_file = self.get_default_result_file_name()
 
-        with open(result_file, 'w', encoding='utf-8') as f:
-            self.print_configuration_parameters(f)
-            self.print_backtest_results(f)
+        report = io.StringIO()
+        self.print_configuration_parameters(report)
+        self.print_backtest_results(report)
+
+        if self.output_trades:
+            self.print_trades(report)
 
-            if self.output_trades:
-                self.print_trades(f)
+        # Written in one go once the report is complete, so a failed report doesn't leave a partial file behind.
+        with open(result_file, 'w', encoding='utf-8') as f:
+            f.write(report.getvalue())
 
         return os.path.join(os.getcwd(), result_file)
@@ -355,7 +355,7 @@ class SimulationTrader(Trader):
         df['high/low'] = (df['high'] + df['low']) / 2
         df['open/close'] = (df['open'] + df['close']) / 2
         df.columns = [c.lower() for c in df.columns]
-        input_arrays_dict = df.to_dict('series')
+        input_arrays_dict = {column: df[column].to_numpy() for column in df.columns}
         cache = {}
 
         trends = [
@@ -578,7 +578,7 @@ class SimulationTrader(Trader):
         self.output_message(f'\nCurrent values: {self.data_view.current_values}')
         self.output_message(f'Balance: ${round(self.balance, self.precision)}')
         self.output_profit_information()
-        if type(self) == SimulationTrader:  # pylint: disable=unidiomatic-typecheck
+        if type(self) is SimulationTrader:  # pylint: disable=unidiomatic-typecheck
             self.output_message(f'\nTrades conducted this simulation: {len(self.trades)}\n')
         else:
             self.output_message(f'\nTrades conducted in live market: {len(self.trades)}\n')
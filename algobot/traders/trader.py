@@ -9,6 +9,16 @@ from algobot.enums import BEARISH, BULLISH, ENTER_LONG, ENTER_SHORT, EXIT_LONG,
 from algobot.helpers import get_label_string
 from algobot.strategies.custom import CustomStrategy
 
+# Cumulative trend of strategy trends and the trends all strategies need to be in for it, in order of precedence.
+CUMULATIVE_TRENDS = (
+    (BEARISH, {BEARISH}),
+    (BULLISH, {BULLISH}),
+    (ENTER_LONG, {BULLISH, ENTER_LONG}),
+    (EXIT_LONG, {BEARISH, EXIT_LONG}),
+    (EXIT_SHORT, {BULLISH, EXIT_SHORT}),
+    (ENTER_SHORT, {BEARISH, ENTER_SHORT}),
+)
+
 
 class Trader:
     """
@@ -297,21 +307,14 @@ class Trader:
         Returns cumulative trend based on the trends provided.
         :return: Integer trend in the form of an enum.
         """
-        # pylint: disable=too-many-return-statements
-        if len(trends) == 0:
+        # Strategy trends are only gathered once instead of being traversed again for every cumulative trend.
+        unique_trends = set(trends)
+        if not unique_trends or None in unique_trends:
             return None
-        if all(trend == BEARISH for trend in trends):
-            return BEARISH
-        if all(trend == BULLISH for trend in trends):
-            return BULLISH
-        if all(trend in (BULLISH, ENTER_LONG) for trend in trends):
-            return ENTER_LONG
-        if all(trend in (BEARISH, EXIT_LONG) for trend in trends):
-            return EXIT_LONG
-        if all(trend in (BULLISH, EXIT_SHORT) for trend in trends):
-            return EXIT_SHORT
-        if all(trend in (BEARISH, ENTER_SHORT) for trend in trends):
-            return ENTER_SHORT
+
+        for cumulative_trend, required_trends in CUMULATIVE_TRENDS:
+            if unique_trends <= required_trends:
+                return cumulative_trend
         return None
 
     @staticmethod
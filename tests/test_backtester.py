@@ -64,6 +64,8 @@ def test_initialization(backtester: Backtester):
     assert backtester.interval_gap_minutes == 14
     assert backtester.interval_gap_multiplier == 15
     assert backtester.data[0]['date_utc'] < backtester.data[1]['date_utc']
+    assert backtester.data_timestamp_range == (backtester.data[0]['date_utc'].timestamp(),
+                                               backtester.data[-1]['date_utc'].timestamp())
 
 
 def test_get_gap_data(backtester: Backtester):
@@ -98,16 +100,54 @@ def test_get_gap_data(backtester: Backtester):
     assert volume == result['volume']
 
 
+def test_get_input_arrays_dict(backtester: Backtester):
+    """
+    Test input arrays dictionary function.
+    """
+    data = backtester.data[:5]
+    input_arrays_dict = backtester.get_input_arrays_dict(data)
+
+    assert list(input_arrays_dict['close']) == [period['close'] for period in data]
+    assert list(input_arrays_dict['high/low']) == [(period['high'] + period['low']) / 2 for period in data]
+    assert list(input_arrays_dict['open/close']) == [(period['open'] + period['close']) / 2 for period in data]
+
+
+def test_get_gap_input_arrays_dict(backtester: Backtester):
+    """
+    Test gap input arrays dictionary function.
+    """
+    gap_values = [backtester.get_price_values(period) for period in backtester.data[:4]]
+    gap_columns = {key: [values[key] for values in gap_values] for key in gap_values[0]}
+    current_values = backtester.get_price_values(backtester.data[4])
+    input_arrays_dict = backtester.get_gap_input_arrays_dict(gap_columns, current_values)
+    expected_arrays_dict = backtester.get_input_arrays_dict(backtester.data[:5])
+
+    for key, series in input_arrays_dict.items():
+        assert list(series) == list(expected_arrays_dict[key])
+
+
 def test_check_data(backtester: Backtester):
     """
     Tests check data function.
     """
-    backtester.data.reverse()
+    backtester.data = backtester.data[::-1]
     backtester.check_data()
 
     assert backtester.data[0]['date_utc'] < backtester.data[-1]['date_utc']
 
 
+def test_check_data_leaves_caller_data_alone():
+    """
+    Tests that check data doesn't reverse the data list provided by the caller.
+    """
+    descending_data = test_data[::-1]
+    backtester = Backtester(starting_balance=1000, data=descending_data, strategies=[], strategy_interval='15m',
+                            symbol='1INCHUSDT')
+
+    assert backtester.data[0]['date_utc'] < backtester.data[-1]['date_utc']
+    assert descending_data[0]['date_utc'] > descending_data[-1]['date_utc']
+
+
 def test_find_date_index(backtester: Backtester):
     """
     Test find date index function.
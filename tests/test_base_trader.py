@@ -4,7 +4,7 @@ Test base trader.
 
 import pytest
 
-from algobot.enums import BEARISH, BULLISH, LONG, SHORT, STOP, TRAILING
+from algobot.enums import BEARISH, BULLISH, ENTER_LONG, EXIT_SHORT, LONG, SHORT, STOP, TRAILING
 from algobot.traders.trader import Trader
 
 
@@ -262,7 +262,10 @@ def test_get_stop_loss_strategy_string(trader: Trader):
     [
         ([BEARISH, BULLISH, BEARISH, None], None),
         ([BEARISH, BEARISH, BEARISH], BEARISH),
-        ([BULLISH, BULLISH, BULLISH, BULLISH, BULLISH], BULLISH)
+        ([BULLISH, BULLISH, BULLISH, BULLISH, BULLISH], BULLISH),
+        ([BULLISH, ENTER_LONG, BULLISH], ENTER_LONG),
+        ([EXIT_SHORT, ENTER_LONG], None),
+        ([], None)
      ]
 )
 def test_get_cumulative_trend(trader: Trader, trends, expected):
@@ -2,15 +2,16 @@
 Test helper functions.
 """
 import os
+from datetime import datetime
 from typing import Any, Dict, List, Union
 from unittest import mock
 
 import pytest
 
 from algobot.enums import BACKTEST, LIVE, OPTIMIZER, SIMULATION
-from algobot.helpers import (ROOT_DIR, convert_long_interval, convert_small_interval, get_caller_string,
-                             get_data_from_parameter, get_label_string, get_normalized_data, get_ups_and_downs,
-                             load_from_csv, parse_precision, parse_strategy_name)
+from algobot.helpers import (ROOT_DIR, convert_all_dates_to_datetime, convert_long_interval, convert_small_interval,
+                             get_caller_string, get_data_from_parameter, get_label_string, get_normalized_data,
+                             get_ups_and_downs, load_from_csv, parse_precision, parse_strategy_name)
 from tests.binance_client_mocker import BinanceMockClient
 
 
@@ -170,6 +171,24 @@ def test_parse_strategy_name(name, expected):
     assert parse_strategy_name(name) == expected, f"Expected parsed strategy to be: {expected}."
 
 
+@pytest.mark.parametrize(
+    "dates, expected",
+    [
+        (["03/06/2021 01:43 AM", "03/06/2021 01:44 AM"], [datetime(2021, 3, 6, 1, 43), datetime(2021, 3, 6, 1, 44)]),
+        (["2021-03-06 13:43:00", "03/06/2021 01:44 PM"], [datetime(2021, 3, 6, 13, 43), datetime(2021, 3, 6, 13, 44)])
+    ]
+)
+def test_convert_all_dates_to_datetime(dates: List[str], expected: List[datetime]):
+    """
+    Test convert all dates to datetime functionality.
+    :param dates: Dates to convert.
+    :param expected: Converted dates to be expected.
+    """
+    data = [{'date_utc': date} for date in dates]
+    convert_all_dates_to_datetime(data)
+    assert [entry['date_utc'] for entry in data] == expected, f"Expected converted dates to be: {expected}."
+
+
 def helper_for_test_load_from_csv(descending: bool) -> List[Dict[str, Union[str, float]]]:
     """
     Helper function for testing load from CSV.